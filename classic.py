@@ -293,20 +293,7 @@ class ApigeeClassic():
             export_dir (str): The directory to save the bundle to.
         """
         url = f"{self.baseurl}/organizations/{self.org}/{api_type}/{api_name}/revisions/{revision}?format=bundle"  # noqa pylint: disable=C0301
-        bundle = self.client.file_get(url)
-        self.write_proxy_bundle(export_dir, api_name, bundle)
-
-    def write_proxy_bundle(self, export_dir, file_name, data):
-        """Writes a proxy bundle to a file.
-
-        Args:
-            export_dir (str): The directory to write the file to.
-            file_name (str): The name of the file.
-            data (bytes): The bundle data.
-        """
-        file_path = f"./{export_dir}/{file_name}.zip"
-        with open(file_path, 'wb') as fl:
-            fl.write(data)
+        self.client.file_get_to(url, f"./{export_dir}/{api_name}.zip")
 
     def fetch_proxy(self, arg_tuple):
         """Fetches the latest revision of an API proxy bundle.
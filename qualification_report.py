@@ -19,27 +19,31 @@ for Apigee migration assessment.
 """
 
 import json
+import operator
 import xlsxwriter  # pylint: disable=E0401
-from qualification_report_mapping.header_mapping import (
-    topology_installation_mapping, proxies_per_env_mapping,
-    northbound_mtls_mapping, company_and_developers_mapping,
-    anti_patterns_mapping, cache_without_expiry_mapping,
-    apps_without_api_products_mapping, json_path_enabled_mapping,
-    cname_anomaly_mapping, unsupported_polices_mapping,
-    api_limits_mapping,
-    org_limits_mapping,
-    env_limits_mapping,
-    api_with_multiple_basepath_mapping,
-    sharding_output,
-    aliases_with_private_keys,
-    sharded_proxies,
-    org_resourcefiles,
-    validation_report,
-)
-from qualification_report_mapping.report_summary import report_summary
+from qualification_report_mapping import header_mapping
+from qualification_report_mapping import report_summary as summary_mapping
 from base_logger import logger
 
 
+def _collect_alias_rows(env_config):
+    """Flattens keystore alias data into one row per alias.
+
+    Args:
+        env_config (dict): The 'envConfig' section of the export data.
+
+    Returns:
+        list: (env, keystore, alias, keyName) tuples in export order.
+    """
+    return [
+        (env, keystore, alias, alias_content.get('keyName'))
+        for env, content in env_config.items()
+        for keystore, keystore_content in content.get('keystores').items()
+        if keystore_content.get('alias_data')
+        for alias, alias_content in keystore_content['alias_data'].items()
+    ]
+
+
 class QualificationReport():  # noqa pylint: disable=R0902,R0904
     """Generates an Excel qualification report for Apigee migration assessment.
 
@@ -147,12 +151,10 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
         """
         # Headings
         col = 0
-        alph = 65
         for val in headers:
-            sheet.write(f'{chr(alph)}1', val, self.heading_format)
+            sheet.write(0, col, val, self.heading_format)
             sheet.set_column(col, col, len(val) + 1)
             col = col+1
-            alph = alph+1
 
     # Get final information box text
     def get_final_info_text_and_format_arr(self, full_text):
@@ -251,56 +253,57 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            proxies_per_env_mapping["headers"], proxies_per_env_sheet)
+            header_mapping.proxies_per_env_mapping["headers"], proxies_per_env_sheet)  # noqa pylint: disable=C0301
 
         env_config = self.export_data.get('envConfig')
         row = 1
+        org_name = self.org_name
+        danger_format = self.danger_format
+        write_string = proxies_per_env_sheet.write_string
+        write_number = proxies_per_env_sheet.write_number
 
-        allowed_no_of_proxies_per_env = self.backend_cfg.get(
+        allowed_no_of_proxies_per_env = self.backend_cfg.getint(
             'inputs', 'NO_OF_PROXIES_PER_ENV_LIMITS')
-        allowed_no_of_shared_flows_per_env = self.backend_cfg.get(
+        allowed_no_of_shared_flows_per_env = self.backend_cfg.getint(
             'inputs', 'NO_OF_SHARED_FLOWS_PER_ENV_LIMITS')
-        allowed_no_of_proxies_and_shared_flows_per_env = self.backend_cfg.get(
-            'inputs', 'NO_OF_PROXIES_AND_SHARED_FLOWS_PER_ENV_LIMITS')
+        allowed_no_of_proxies_and_shared_flows_per_env = (
+            self.backend_cfg.getint(
+                'inputs', 'NO_OF_PROXIES_AND_SHARED_FLOWS_PER_ENV_LIMITS'))
 
         for key, value in env_config.items():
             # Org name
             col = 0
-            proxies_per_env_sheet.write(row, col, self.org_name)
+            write_string(row, col, org_name)
             # Env name
             col += 1
-            proxies_per_env_sheet.write(row, col, key)
+            write_string(row, col, key)
             # No of Proxies
             col += 1
             num_proxies = len(value['apis'])
-            if num_proxies > int(allowed_no_of_proxies_per_env):
-                proxies_per_env_sheet.write(
-                    row, col, num_proxies, self.danger_format)
+            if num_proxies > allowed_no_of_proxies_per_env:
+                write_number(row, col, num_proxies, danger_format)
             else:
-                proxies_per_env_sheet.write(row, col, num_proxies)
+                write_number(row, col, num_proxies)
             # No of Sharedflows
             col += 1
             num_sf = len(value['sharedflows'])
-            if num_sf > int(allowed_no_of_shared_flows_per_env):
-                proxies_per_env_sheet.write(
-                    row, col, num_sf, self.danger_format)
+            if num_sf > allowed_no_of_shared_flows_per_env:
+                write_number(row, col, num_sf, danger_format)
             else:
-                proxies_per_env_sheet.write(row, col, num_sf)
+                write_number(row, col, num_sf)
             # Total no of Proxies & Sharedflows
             col += 1
             total_api_sf = num_proxies + num_sf
-            if total_api_sf > int(allowed_no_of_proxies_and_shared_flows_per_env):   # noqa pylint: disable=C0301
-                proxies_per_env_sheet.write(
-                    row, col, total_api_sf, self.danger_format)
+            if total_api_sf > allowed_no_of_proxies_and_shared_flows_per_env:   # noqa pylint: disable=C0301
+                write_number(row, col, total_api_sf, danger_format)
             else:
-                proxies_per_env_sheet.write(
-                    row, col, total_api_sf)
+                write_number(row, col, total_api_sf)
             row += 1
 
         proxies_per_env_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            proxies_per_env_mapping, proxies_per_env_sheet)
+            header_mapping.proxies_per_env_mapping, proxies_per_env_sheet)
 
     def report_north_bound_mtls(self):
         """Generates the "Northbound mTLS" report sheet."""
@@ -312,51 +315,53 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            northbound_mtls_mapping["headers"], nb_mtls_sheet)
+            header_mapping.northbound_mtls_mapping["headers"], nb_mtls_sheet)
 
         env_config = self.export_data.get('envConfig')
         row = 1
+        org_name = self.org_name
+        danger_format = self.danger_format
+        write = nb_mtls_sheet.write
 
         for env, value in env_config.items():
             vhosts = value['vhosts']
             for vhost, vhost_content in vhosts.items():
                 # org name
                 col = 0
-                nb_mtls_sheet.write(row, col, self.org_name)
+                write(row, col, org_name)
                 # Env name
                 col += 1
-                nb_mtls_sheet.write(row, col, env)
+                write(row, col, env)
                 col += 1
-                nb_mtls_sheet.write(row, col, vhost)
+                write(row, col, vhost)
 
                 if vhost_content.get('sSLInfo'):
                     sslinfo = vhost_content['sSLInfo']
                     col += 1
-                    nb_mtls_sheet.write(
-                        row, col, sslinfo['enabled'], self.danger_format)
+                    write(row, col, sslinfo['enabled'], danger_format)
                     col += 1
-                    nb_mtls_sheet.write(
+                    write(
                         row, col, sslinfo['clientAuthEnabled'],
-                        self.danger_format)
+                        danger_format)
                     col += 1
                     if sslinfo.get('keyStore'):
-                        nb_mtls_sheet.write(
+                        write(
                             row, col, sslinfo['keyStore'],
-                            self.danger_format)
+                            danger_format)
                     elif vhost_content.get("useBuiltInFreeTrialCert") is True:
-                        nb_mtls_sheet.write(
+                        write(
                             row, col, "Free Trial Cert Used",
-                            self.danger_format)
+                            danger_format)
 
                 else:
                     col += 1
-                    nb_mtls_sheet.write(row, col, 'False')
+                    write(row, col, 'False')
                 row += 1
 
         nb_mtls_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            northbound_mtls_mapping, nb_mtls_sheet)
+            header_mapping.northbound_mtls_mapping, nb_mtls_sheet)
 
     def report_company_and_developer(self):
         """Generates the "Company And Developers" report sheet."""
@@ -369,24 +374,26 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            company_and_developers_mapping["headers"], companies_developers)   # noqa pylint: disable=C0301
+            header_mapping.company_and_developers_mapping["headers"], companies_developers)   # noqa pylint: disable=C0301
 
         org_config = self.export_data.get('orgConfig')
         companies = org_config['companies']
         row = 1
+        org_name = self.org_name
+        write = companies_developers.write
 
         # Org name
         for company in companies:
             col = 0
-            companies_developers.write(row, col, self.org_name)
+            write(row, col, org_name)
             col += 1
-            companies_developers.write(row, col, company)
+            write(row, col, company)
             row += 1
 
         companies_developers.autofit()
         # Info block
         self.qualification_report_info_box(
-            company_and_developers_mapping, companies_developers)
+            header_mapping.company_and_developers_mapping, companies_developers)  # noqa pylint: disable=C0301
 
     def report_anti_patterns(self):
         """Generates the "Anti Patterns" report sheet."""
@@ -396,9 +403,11 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            anti_patterns_mapping["headers"], anti_patterns_sheet)
+            header_mapping.anti_patterns_mapping["headers"], anti_patterns_sheet)  # noqa pylint: disable=C0301
 
         row = 1
+        org_name = self.org_name
+        write = anti_patterns_sheet.write
 
         proxy_map = self.export_data['proxy_dependency_map']
         for proxy, values in proxy_map.items():
@@ -408,22 +417,22 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
             anti_pattern_quota = values.get('qualification', {}).get('AntiPatternQuota', {})   # noqa pylint: disable=C0301
             for policy, value in anti_pattern_quota.items():
                 col = 0
-                anti_patterns_sheet.write(row, col, self.org_name)
+                write(row, col, org_name)
                 col += 1
-                anti_patterns_sheet.write(row, col, proxy)
+                write(row, col, proxy)
                 col += 1
-                anti_patterns_sheet.write(row, col, policy)
+                write(row, col, policy)
                 col += 1
-                anti_patterns_sheet.write(row, col, value['distributed'])
+                write(row, col, value['distributed'])
                 col += 1
-                anti_patterns_sheet.write(row, col, value['Synchronous'])
+                write(row, col, value['Synchronous'])
 
                 row += 1
 
         anti_patterns_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            anti_patterns_mapping, anti_patterns_sheet)
+            header_mapping.anti_patterns_mapping, anti_patterns_sheet)
 
     def report_cache_without_expiry(self):
         """Generates the "Cache Without Expiry" report sheet."""
@@ -436,9 +445,11 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            cache_without_expiry_mapping["headers"], cache_without_expiry_sheet)   # noqa pylint: disable=C0301
+            header_mapping.cache_without_expiry_mapping["headers"], cache_without_expiry_sheet)   # noqa pylint: disable=C0301
 
         row = 1
+        org_name = self.org_name
+        write = cache_without_expiry_sheet.write
 
         proxy_map = self.export_data['proxy_dependency_map']
         for proxy, values in proxy_map.items():
@@ -448,20 +459,20 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
             cache_without_expiry = values.get('qualification', {}).get('CacheWithoutExpiry', {})   # noqa pylint: disable=C0301
             for policy, value in cache_without_expiry.items():
                 col = 0
-                cache_without_expiry_sheet.write(row, col, self.org_name)
+                write(row, col, org_name)
                 col += 1
-                cache_without_expiry_sheet.write(row, col, proxy)
+                write(row, col, proxy)
                 col += 1
-                cache_without_expiry_sheet.write(row, col, policy)
+                write(row, col, policy)
                 col += 1
-                cache_without_expiry_sheet.write(row, col, value)
+                write(row, col, value)
 
                 row += 1
 
         cache_without_expiry_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            cache_without_expiry_mapping, cache_without_expiry_sheet)
+            header_mapping.cache_without_expiry_mapping, cache_without_expiry_sheet)  # noqa pylint: disable=C0301
 
     def report_apps_without_api_products(self):
         """Generates the "Apps Without ApiProducts" report sheet."""
@@ -473,27 +484,28 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            apps_without_api_products_mapping["headers"], apps_without_products_sheet)   # noqa pylint: disable=C0301
+            header_mapping.apps_without_api_products_mapping["headers"], apps_without_products_sheet)   # noqa pylint: disable=C0301
 
         org_config = self.export_data.get('orgConfig')
         row = 1
+        org_name = self.org_name
+        write = apps_without_products_sheet.write
 
         apps = org_config['apps']
         for app, value in apps.items():
             credentials = value.get('credentials', [])
             if len(credentials) == 0:
                 col = 0
-                apps_without_products_sheet.write(row, col, self.org_name)   # noqa pylint: disable=C0301
+                write(row, col, org_name)
                 # app name
                 col += 1
-                apps_without_products_sheet.write(row, col, value.get('name', 'Unknown App Name'))   # noqa pylint: disable=C0301
+                write(row, col, value.get('name', 'Unknown App Name'))
                 # id
                 col += 1
-                apps_without_products_sheet.write(row, col, app)
+                write(row, col, app)
                 # status
                 col += 1
-                apps_without_products_sheet.write(
-                    row, col, 'No Credentials Found')
+                write(row, col, 'No Credentials Found')
             else:
                 no_products = False
                 for each_cred in credentials:
@@ -501,22 +513,21 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
                         no_products = True
                 if no_products:
                     col = 0
-                    apps_without_products_sheet.write(row, col, self.org_name)   # noqa pylint: disable=C0301
+                    write(row, col, org_name)
                     # app name
                     col += 1
-                    apps_without_products_sheet.write(row, col, value['name'])
+                    write(row, col, value['name'])
                     # id
                     col += 1
-                    apps_without_products_sheet.write(row, col, app)
+                    write(row, col, app)
                     # status
                     col += 1
-                    apps_without_products_sheet.write(
-                        row, col, 'No apiProducts associated')
+                    write(row, col, 'No apiProducts associated')
 
         apps_without_products_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            apps_without_api_products_mapping, apps_without_products_sheet)  # noqa
+            header_mapping.apps_without_api_products_mapping, apps_without_products_sheet)  # noqa
 
     def report_json_path_enabled(self):
         """Generates the "Json Path Enabled" report sheet."""
@@ -529,9 +540,11 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            json_path_enabled_mapping["headers"], json_path_enabled_sheet)
+            header_mapping.json_path_enabled_mapping["headers"], json_path_enabled_sheet)  # noqa pylint: disable=C0301
 
         row = 1
+        org_name = self.org_name
+        write = json_path_enabled_sheet.write
 
         proxy_map = self.export_data['proxy_dependency_map']
         for proxy, values in proxy_map.items():
@@ -542,20 +555,20 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
             for policy, value in json_path_enabled.items():
                 col = 0
-                json_path_enabled_sheet.write(row, col, self.org_name)
+                write(row, col, org_name)
                 col += 1
-                json_path_enabled_sheet.write(row, col, proxy)
+                write(row, col, proxy)
                 col += 1
-                json_path_enabled_sheet.write(row, col, policy)
+                write(row, col, policy)
                 col += 1
-                json_path_enabled_sheet.write(row, col, value)
+                write(row, col, value)
 
                 row += 1
 
         json_path_enabled_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            json_path_enabled_mapping, json_path_enabled_sheet)
+            header_mapping.json_path_enabled_mapping, json_path_enabled_sheet)
 
     def report_cname_anomaly(self):
         """Generates the "CName Anomaly" report sheet."""
@@ -566,10 +579,12 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            cname_anomaly_mapping["headers"], cname_anamoly)
+            header_mapping.cname_anomaly_mapping["headers"], cname_anamoly)
 
         env_config = self.export_data.get('envConfig')
         row = 1
+        org_name = self.org_name
+        write = cname_anamoly.write
 
         for key, value in env_config.items():
             vhosts = value['vhosts']
@@ -577,17 +592,17 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
                 if vhosts[vhost].get('useBuiltInFreeTrialCert', False):
                     # org name
                     col = 0
-                    cname_anamoly.write(row, col, self.org_name)
+                    write(row, col, org_name)
                     # Env name
                     col += 1
-                    cname_anamoly.write(row, col, key)
+                    write(row, col, key)
                     col += 1
-                    cname_anamoly.write(row, col, vhosts[vhost]['name'])
+                    write(row, col, vhosts[vhost]['name'])
                     row += 1
 
         cname_anamoly.autofit()
         # Info block
-        self.qualification_report_info_box(cname_anomaly_mapping, cname_anamoly)  # noqa
+        self.qualification_report_info_box(header_mapping.cname_anomaly_mapping, cname_anamoly)  # noqa
 
     def report_unsupported_policies(self):
         """Generates the "Unsupported Policies" report sheet."""
@@ -600,9 +615,11 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            unsupported_polices_mapping["headers"], unsupported_polices_sheet)
+            header_mapping.unsupported_polices_mapping["headers"], unsupported_polices_sheet)  # noqa pylint: disable=C0301
 
         row = 1
+        org_name = self.org_name
+        write = unsupported_polices_sheet.write
 
         proxy_map = self.export_data['proxy_dependency_map']
         for proxy, values in proxy_map.items():
@@ -612,20 +629,20 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
             policies = values.get('qualification', {}).get('policies', {})
             for policy_name, policy in policies.items():
                 col = 0
-                unsupported_polices_sheet.write(row, col, self.org_name)
+                write(row, col, org_name)
                 col += 1
-                unsupported_polices_sheet.write(row, col, proxy)
+                write(row, col, proxy)
                 col += 1
-                unsupported_polices_sheet.write(row, col, policy_name)
+                write(row, col, policy_name)
                 col += 1
-                unsupported_polices_sheet.write(row, col, policy)
+                write(row, col, policy)
 
                 row += 1
 
         unsupported_polices_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            unsupported_polices_mapping, unsupported_polices_sheet)
+            header_mapping.unsupported_polices_mapping, unsupported_polices_sheet)  # noqa pylint: disable=C0301
 
     def report_api_limits(self):
         """Generates the "Product Limits - API Limits" report sheet."""
@@ -638,31 +655,35 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            api_limits_mapping["headers"], api_limits_sheet)
+            header_mapping.api_limits_mapping["headers"], api_limits_sheet)
 
-        allowed_no_of_revisions_per_proxy = self.backend_cfg.get(
+        allowed_no_of_revisions_per_proxy = self.backend_cfg.getint(
             'inputs', 'NO_OF_API_REVISIONS_IN_API_PROXY')
         org_config = self.export_data.get('orgConfig')
         row = 1
+        org_name = self.org_name
+        danger_format = self.danger_format
+        write_string = api_limits_sheet.write_string
+        write_number = api_limits_sheet.write_number
 
         for key, value in org_config['apis'].items():
             # Org name
             col = 0
-            api_limits_sheet.write(row, col, self.org_name)
+            write_string(row, col, org_name)
             # Api name
             col += 1
-            api_limits_sheet.write(row, col, key)
+            write_string(row, col, key)
             # Revisions
             col += 1
-            if len(value) > int(allowed_no_of_revisions_per_proxy):
-                api_limits_sheet.write(row, col, len(value), self.danger_format)   # noqa pylint: disable=C0301
+            if len(value) > allowed_no_of_revisions_per_proxy:
+                write_number(row, col, len(value), danger_format)
             else:
-                api_limits_sheet.write(row, col, len(value))
+                write_number(row, col, len(value))
             row += 1
 
         api_limits_sheet.autofit()
         # Info block
-        self.qualification_report_info_box(api_limits_mapping, api_limits_sheet)   # noqa pylint: disable=C0301
+        self.qualification_report_info_box(header_mapping.api_limits_mapping, api_limits_sheet)   # noqa pylint: disable=C0301
 
     def report_org_limits(self):
         """Generates the "Product Limits - Org Limits" report sheet."""
@@ -672,16 +693,16 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
             '------------------- Product Limits - Org Limits -----------------------')  # noqa
         org_limits_sheet = self.workbook.add_worksheet(
             name='Product Limits - Org Limits')
-        allowed_no_of_kvms_per_org = self.backend_cfg.get(
+        allowed_no_of_kvms_per_org = self.backend_cfg.getint(
             'inputs', 'NO_OF_KVMS_PER_ORG')
-        allowed_no_of_apps_per_org = self.backend_cfg.get(
+        allowed_no_of_apps_per_org = self.backend_cfg.getint(
             'inputs', 'NO_OF_APPS_PER_ORG')
-        allowed_no_of_apirproducts_per_org = self.backend_cfg.get(
+        allowed_no_of_apirproducts_per_org = self.backend_cfg.getint(
             'inputs', 'NO_OF_API_PRODUCTS_PER_ORG')
 
         # Headings
         self.qualification_report_heading(
-            org_limits_mapping["headers"], org_limits_sheet)
+            header_mapping.org_limits_mapping["headers"], org_limits_sheet)
 
         org_config = self.export_data.get('orgConfig')
         row = 1
@@ -694,7 +715,7 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
         org_limits_sheet.write(row, col, len(org_config['developers']))
         # KVM count
         col += 1
-        if len(org_config['kvms']) > int(allowed_no_of_kvms_per_org):
+        if len(org_config['kvms']) > allowed_no_of_kvms_per_org:
             org_limits_sheet.write(row, col, len(
                 org_config['kvms']), self.danger_format)
         else:
@@ -718,7 +739,7 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # apps count
         col += 1
-        if len(org_config['apps']) > int(allowed_no_of_apps_per_org):
+        if len(org_config['apps']) > allowed_no_of_apps_per_org:
             org_limits_sheet.write(row, col, len(
                 org_config['apps']), self.danger_format)
         else:
@@ -726,7 +747,7 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # api products count
         col += 1
-        if len(org_config['apiProducts']) > int(allowed_no_of_apirproducts_per_org):  # noqa
+        if len(org_config['apiProducts']) > allowed_no_of_apirproducts_per_org:  # noqa
             org_limits_sheet.write(row, col, len(
                 org_config['apiProducts']), self.danger_format)
         else:
@@ -738,7 +759,7 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         org_limits_sheet.autofit()
         # Info block
-        self.qualification_report_info_box(org_limits_mapping, org_limits_sheet)  # noqa
+        self.qualification_report_info_box(header_mapping.org_limits_mapping, org_limits_sheet)  # noqa
 
     def report_env_limits(self):
         """Generates the "Product Limits - Env Limits" report sheet."""
@@ -749,76 +770,78 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
         env_limits_sheet = self.workbook.add_worksheet(
             name='Product Limits - Env Limits')
 
-        allowed_no_of_kvms_per_env = self.backend_cfg.get(
+        allowed_no_of_kvms_per_env = self.backend_cfg.getint(
             'inputs', 'NO_OF_KVMS_PER_ENV')
-        allowed_no_of_target_servers_per_env = self.backend_cfg.get(
+        allowed_no_of_target_servers_per_env = self.backend_cfg.getint(
             'inputs', 'NO_OF_TARGET_SERVERS_PER_ENV')
 
         # Headings
         self.qualification_report_heading(
-            env_limits_mapping["headers"], env_limits_sheet)
+            header_mapping.env_limits_mapping["headers"], env_limits_sheet)
 
         env_config = self.export_data.get('envConfig')
         row = 1
+        org_name = self.org_name
+        danger_format = self.danger_format
+        write_string = env_limits_sheet.write_string
+        write_number = env_limits_sheet.write_number
 
         for key, value in env_config.items():
             # Org name
             col = 0
-            env_limits_sheet.write(row, col, self.org_name)
+            write_string(row, col, org_name)
             # Env name
             col += 1
-            env_limits_sheet.write(row, col, key)
+            write_string(row, col, key)
             # Target servers
             col += 1
-            if len(value['targetServers']) > int(allowed_no_of_target_servers_per_env):  # noqa
-                env_limits_sheet.write(row, col, len(
-                    value['targetServers']), self.danger_format)
+            num_target_servers = len(value['targetServers'])
+            if num_target_servers > allowed_no_of_target_servers_per_env:
+                write_number(row, col, num_target_servers, danger_format)
             else:
-                env_limits_sheet.write(row, col, len(value['targetServers']))
+                write_number(row, col, num_target_servers)
             # Caches
             col += 1
-            env_limits_sheet.write(row, col, len(value['caches']))
+            write_number(row, col, len(value['caches']))
             # Certs
             col += 1
-            certs = 0
-            for _, keystorecontent in value['keystores'].items():
-                certs = certs + len(keystorecontent['aliases'])
-            env_limits_sheet.write(row, col, certs)
+            certs = sum(len(keystorecontent['aliases'])
+                        for keystorecontent in value['keystores'].values())
+            write_number(row, col, certs)
             # KVMs
             col += 1
-            if len(value['kvms']) > int(allowed_no_of_kvms_per_env):
-                env_limits_sheet.write(row, col, len(
-                    value['kvms']), self.danger_format)
+            num_kvms = len(value['kvms'])
+            if num_kvms > allowed_no_of_kvms_per_env:
+                write_number(row, col, num_kvms, danger_format)
             else:
-                env_limits_sheet.write(row, col, len(value['kvms']))
+                write_number(row, col, num_kvms)
 
             # encrypted kvm
             col += 1
-            encrypted_count = 0
-            for kvm, kvm_content in value['kvms'].items():
-                if len(kvm) != 0 and kvm_content.get("encrypted"):
-                    encrypted_count = encrypted_count+1
+            encrypted_count = sum(
+                1 for kvm, kvm_content in value['kvms'].items()
+                if len(kvm) != 0 and kvm_content.get("encrypted"))
 
             if encrypted_count > 0:
-                env_limits_sheet.write(row, col, encrypted_count, self.danger_format)  # noqa
+                write_number(row, col, encrypted_count, danger_format)
             else:
-                env_limits_sheet.write(row, col, encrypted_count)
+                write_number(row, col, encrypted_count)
 
             # non encrypted kvm
             col += 1
-            env_limits_sheet.write(row, col, len(value['kvms']) - encrypted_count)  # noqa
+            write_number(row, col, num_kvms - encrypted_count)
 
             # Virtual hosts
             col += 1
-            env_limits_sheet.write(row, col, len(value['vhosts']))
+            write_number(row, col, len(value['vhosts']))
             # references
             col += 1
-            env_limits_sheet.write(row, col, len(value['references']))
+            write_number(row, col, len(value['references']))
             row += 1
 
         env_limits_sheet.autofit()
         # Info block
-        self.qualification_report_info_box(env_limits_mapping, env_limits_sheet)   # noqa pylint: disable=C0301
+        self.qualification_report_info_box(header_mapping.env_limits_mapping, env_limits_sheet)   # noqa pylint: disable=C0301
 
     def report_api_with_multiple_basepaths(self):
         """Generates the "APIs With Multiple BasePaths" report sheet."""
@@ -831,9 +854,13 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            api_with_multiple_basepath_mapping["headers"], api_with_multiple_basepaths_sheet)     # noqa pylint: disable=C0301
+            header_mapping.api_with_multiple_basepath_mapping["headers"], api_with_multiple_basepaths_sheet)     # noqa pylint: disable=C0301
 
         row = 1
+        org_name = self.org_name
+        danger_format = self.danger_format
+        yellow_format = self.yellow_format
+        write = api_with_multiple_basepaths_sheet.write
 
         proxy_map = self.export_data['proxy_dependency_map']
         for proxy, values in proxy_map.items():
@@ -841,29 +868,27 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
                 continue
 
             base_paths = values.get('qualification', {}).get('base_paths', [])  # noqa
-            base_paths = [
-                str(path) if path is not None else 'None' for path in base_paths]  # noqa
+            base_paths_count = len(base_paths)
+            base_paths_text = '\n'.join(
+                str(path) if path is not None else 'None' for path in base_paths)  # noqa
             col = 0
-            api_with_multiple_basepaths_sheet.write(row, col, self.org_name)
+            write(row, col, org_name)
             col += 1
-            api_with_multiple_basepaths_sheet.write(row, col, proxy)
+            write(row, col, proxy)
             col += 1
-            if len(base_paths) > 5:
-                api_with_multiple_basepaths_sheet.write(
-                    row, col, '\n'.join(base_paths), self.danger_format)
-            elif len(base_paths) > 1:
-                api_with_multiple_basepaths_sheet.write(
-                    row, col, '\n'.join(base_paths), self.yellow_format)
-            elif len(base_paths) == 1:
-                api_with_multiple_basepaths_sheet.write(
-                    row, col, '\n'.join(base_paths))
+            if base_paths_count > 5:
+                write(row, col, base_paths_text, danger_format)
+            elif base_paths_count > 1:
+                write(row, col, base_paths_text, yellow_format)
+            elif base_paths_count == 1:
+                write(row, col, base_paths_text)
 
             row += 1
 
         api_with_multiple_basepaths_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            api_with_multiple_basepath_mapping, api_with_multiple_basepaths_sheet)  # noqa
+            header_mapping.api_with_multiple_basepath_mapping, api_with_multiple_basepaths_sheet)  # noqa
 
     def sharding(self):
         """Generates the "Target Environments" report sheet (Sharding info)."""
@@ -876,37 +901,39 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            sharding_output["headers"], sharding_output_sheet)
+            header_mapping.sharding_output["headers"], sharding_output_sheet)
 
         sharding_env_output = self.export_data.get('sharding_output')
         row = 1
+        org_name = self.org_name
+        write = sharding_output_sheet.write
 
         for env, sharded_envs in sharding_env_output.items():
             for sharded_env, content in sharded_envs.items():
                 col = 0
-                sharding_output_sheet.write(row, col, self.org_name)
+                write(row, col, org_name)
                 col += 1
-                sharding_output_sheet.write(row, col, env)
+                write(row, col, env)
                 col += 1
-                sharding_output_sheet.write(row, col, sharded_env)
+                write(row, col, sharded_env)
                 col += 1
                 proxies_list = content.get("proxyname", [])
-                sharding_output_sheet.write(row, col, '\n'.join(proxies_list))
+                write(row, col, '\n'.join(proxies_list))
                 col += 1
                 shared_flows_list = content.get("shared_flow", [])
-                sharding_output_sheet.write(row, col, '\n'.join(shared_flows_list))   # noqa pylint: disable=C0301
+                write(row, col, '\n'.join(shared_flows_list))
                 col += 1
-                sharding_output_sheet.write(row, col, len(proxies_list))
+                write(row, col, len(proxies_list))
                 col += 1
-                sharding_output_sheet.write(row, col, len(shared_flows_list))
+                write(row, col, len(shared_flows_list))
                 col += 1
-                sharding_output_sheet.write(row, col, len(
+                write(row, col, len(
                     proxies_list) + len(shared_flows_list))
                 row += 1
 
         sharding_output_sheet.autofit()
         # Info block
-        self.qualification_report_info_box(sharding_output, sharding_output_sheet)   # noqa pylint: disable=C0301
+        self.qualification_report_info_box(header_mapping.sharding_output, sharding_output_sheet)   # noqa pylint: disable=C0301
 
     def report_alias_keycert(self):
         """Generates the "Aliases with private keys" report sheet."""
@@ -917,30 +944,24 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            aliases_with_private_keys["headers"], aliases_with_private_keys_sheet)   # noqa pylint: disable=C0301
+            header_mapping.aliases_with_private_keys["headers"], aliases_with_private_keys_sheet)   # noqa pylint: disable=C0301
 
         row = 1
-        for env, content in self.export_data['envConfig'].items():  # noqa
-            for keystore, keystore_content in content.get('keystores').items():  # noqa
-                if keystore_content.get('alias_data'):
-                    for alias, alias_content in keystore_content.get('alias_data').items():  # noqa
-                        col = 0
-                        aliases_with_private_keys_sheet.write(row, col, self.org_name)   # noqa pylint: disable=C0301
-                        col += 1
-                        aliases_with_private_keys_sheet.write(row, col, env)
-                        col += 1
-                        aliases_with_private_keys_sheet.write(row, col, keystore)   # noqa pylint: disable=C0301
-                        col += 1
-                        aliases_with_private_keys_sheet.write(row, col, alias)
-                        col += 1
-                        if alias_content.get('keyName'):
-                            aliases_with_private_keys_sheet.write(
-                                row, col, alias_content.get('keyName'), self.danger_format)  # noqa
-                        row += 1
+        org_name = self.org_name
+        danger_format = self.danger_format
+        write = aliases_with_private_keys_sheet.write
+        aliases_rows = _collect_alias_rows(self.export_data['envConfig'])
+        for env, keystore, alias, keyname in aliases_rows:
+            aliases_with_private_keys_sheet.write_row(
+                row, 0, (org_name, env, keystore, alias))
+            if keyname:
+                write(
+                    row, 4, keyname, danger_format)
+            row += 1
         aliases_with_private_keys_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            aliases_with_private_keys, aliases_with_private_keys_sheet)
+            header_mapping.aliases_with_private_keys, aliases_with_private_keys_sheet)  # noqa pylint: disable=C0301
 
     def sharded_proxies(self):
         """Generates the "Sharded Proxies" report sheet."""
@@ -950,52 +971,57 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            sharded_proxies["headers"], sharded_proxies_sheet)
+            header_mapping.sharded_proxies["headers"], sharded_proxies_sheet)
 
         row = 1
+        org_name = self.org_name
+        write = sharded_proxies_sheet.write
 
         proxy_map = self.export_data['proxy_dependency_map']
         for proxy, values in proxy_map.items():
             if values.get("is_split"):
                 sharded_proxies_list = values.get("split_output_names")
                 col = 0
-                sharded_proxies_sheet.write(row, col, self.org_name)
+                write(row, col, org_name)
                 col += 1
-                sharded_proxies_sheet.write(row, col, proxy)
+                write(row, col, proxy)
                 col += 1
-                sharded_proxies_sheet.write(row, col, '\n'.join(sharded_proxies_list))  # noqa
+                write(row, col, '\n'.join(sharded_proxies_list))
                 row += 1
 
         sharded_proxies_sheet.autofit()
         # Info block
-        self.qualification_report_info_box(sharded_proxies, sharded_proxies_sheet)   # noqa pylint: disable=C0301
+        self.qualification_report_info_box(header_mapping.sharded_proxies, sharded_proxies_sheet)   # noqa pylint: disable=C0301
 
     def validation_report(self):
         """Generates the "Validation Report" sheet."""
         logger.info('------------------- Validation Report -----------------------')  # noqa
 
         validation_report_sheet = self.workbook.add_worksheet(name='Validation Report')  # noqa
-        self.qualification_report_heading(validation_report["headers"], validation_report_sheet)   # noqa pylint: disable=C0301
+        self.qualification_report_heading(header_mapping.validation_report["headers"], validation_report_sheet)   # noqa pylint: disable=C0301
 
         row = 1
+        danger_format = self.danger_format
+        green_format = self.green_format
+        write = validation_report_sheet.write
         for key, value in self.export_data['validation_report'].items():
             # col = 0
             if key == "report":
                 continue
-            # validation_report_sheet.write(row, col, key)
+            # write(row, col, key)
 
             for values in value:
                 col = 0
-                validation_report_sheet.write(row, col, key)
+                write(row, col, key)
                 col += 1
-                validation_report_sheet.write(row, col, values['name'])
+                write(row, col, values['name'])
                 col += 1
                 if values['importable']:
-                    validation_report_sheet.write(row, col, values['importable'], self.green_format)   # noqa pylint: disable=C0301
+                    write(row, col, values['importable'], green_format)
                     col += 1
-                    validation_report_sheet.write(row, col, 'N/A')
+                    write(row, col, 'N/A')
                 if not values['importable']:
-                    validation_report_sheet.write(row, col, values['importable'], self.danger_format)   # noqa pylint: disable=C0301
+                    write(row, col, values['importable'], danger_format)
                     col += 1
                     reason_str = {}
                     violations = values.get('reason', [{'violations': []}])
@@ -1008,12 +1034,12 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
                     else:
                         reason_str = violations[0].get('violations', [])
 
-                    validation_report_sheet.write(row, col, json.dumps(reason_str, indent=2))   # noqa pylint: disable=C0301
+                    write(row, col, json.dumps(reason_str, indent=2))
                 col += 1
                 if 'imported' in values:
-                    validation_report_sheet.write(row, col, values['imported'])   # noqa pylint: disable=C0301
+                    write(row, col, values['imported'])
                 else:
-                    validation_report_sheet.write(row, col, 'UNKNOWN')
+                    write(row, col, 'UNKNOWN')
                 row += 1
         validation_report_sheet.autofit()
 
@@ -1027,21 +1053,23 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            org_resourcefiles["headers"], org_resourcefiles_sheet)
+            header_mapping.org_resourcefiles["headers"], org_resourcefiles_sheet)  # noqa pylint: disable=C0301
 
         row = 1
+        org_name = self.org_name
+        write = org_resourcefiles_sheet.write
 
         for key in self.export_data['orgConfig']["resourcefiles"]:  # noqa
             col = 0
-            org_resourcefiles_sheet.write(row, col, self.org_name)
+            write(row, col, org_name)
             col += 1
-            org_resourcefiles_sheet.write(row, col, key)
+            write(row, col, key)
 
             row += 1
         org_resourcefiles_sheet.autofit()
         # Info block
         self.qualification_report_info_box(
-            org_resourcefiles, org_resourcefiles_sheet)
+            header_mapping.org_resourcefiles, org_resourcefiles_sheet)
 
     def report_network_topology(self):
         """Generates the "Apigee (4G) components" report sheet (Topology)."""
@@ -1054,9 +1082,15 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
         # Headings
         self.qualification_report_heading(
-            topology_installation_mapping["headers"], topology_installation_sheet)  # noqa
+            header_mapping.topology_installation_mapping["headers"], topology_installation_sheet)  # noqa
 
         row = 1
+        write = topology_installation_sheet.write
+        write_row = topology_installation_sheet.write_row
+
+        # Columns after Component come straight from the pod instance
+        instance_values = operator.itemgetter(
+            *header_mapping.topology_installation_mapping["key_mapping"])
 
         if len(self.topology_mapping) != 0:
             for dc in self.topology_mapping['data_center_mapping']:
@@ -1065,19 +1099,15 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
 
                     for pod_instance in self.topology_mapping['data_center_mapping'][dc][pod]:   # noqa pylint: disable=C0301
                         col = 0
-                        topology_installation_sheet.write(row, col, dc)
+                        write(row, col, dc)
                         col += 1
-                        topology_installation_sheet.write(row, col, pod)
+                        write(row, col, pod)
                         col += 1
 
-                        topology_installation_sheet.write(
-                            row, col, '\n'.join(pod_instance['type']))
+                        write(row, col, '\n'.join(pod_instance['type']))
                         col += 1
 
-                        for col_key_map in topology_installation_mapping["key_mapping"]:   # noqa pylint: disable=C0301
-                            topology_installation_sheet.write(
-                                row, col, pod_instance[col_key_map])
-                            col += 1
+                        write_row(row, col, instance_values(pod_instance))
 
                         row += 1
         topology_installation_sheet.autofit()
@@ -1090,48 +1120,57 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
             '------------------- Qualification Summary -----------------------')  # noqa
         qualification_summary_sheet = self.workbook.add_worksheet(
             name='Qualification Summary')
+        report_summary = summary_mapping.report_summary
+
+        summary_format = self.summary_format
+        summary_link_format = self.summary_link_format
+        passed_format = {
+            'type': 'text',
+            'criteria': 'containing',
+            'value': 'PASSED',
+            'format': self.summary_cell_green_format
+        }
+        failed_format = {
+            'type': 'text',
+            'criteria': 'containing',
+            'value': 'FAILED',
+            'format': self.summary_cell_danger_format
+        }
+        source_apigee_version = self.cfg.get('inputs', 'SOURCE_APIGEE_VERSION')  # noqa pylint: disable=C0301
 
         col = 0
         qualification_summary_sheet.set_column(
             col, col+1, int(report_summary["col_width"])+1)
         qualification_summary_sheet.merge_range(
-            f'A{report_summary["header_row"]}:B{report_summary["header_row"]}', report_summary["header_text"], self.summary_main_header_format)   # noqa pylint: disable=C0301
+            report_summary["header_row"]-1, 0, report_summary["header_row"]-1, 1, report_summary["header_text"], self.summary_main_header_format)   # noqa pylint: disable=C0301
 
         row = report_summary["header_row"]+1
 
         for block in report_summary["blocks"]:
 
-            if "APIGEE_SOURCE" in block and self.cfg.get('inputs', 'SOURCE_APIGEE_VERSION') != block["APIGEE_SOURCE"]:   # noqa pylint: disable=C0301
+            if "APIGEE_SOURCE" in block and source_apigee_version != block["APIGEE_SOURCE"]:   # noqa pylint: disable=C0301
                 break
 
             qualification_summary_sheet.merge_range(
-                f'A{row}:B{row}', block["header"], self.summary_block_header_format)   # noqa pylint: disable=C0301
+                row-1, 0, row-1, 1, block["header"], self.summary_block_header_format)   # noqa pylint: disable=C0301
             row = row+1
 
             col = 0
             for row_sheet in block["sheets"]:
                 if "link_of_text" in row_sheet:
                     qualification_summary_sheet.write_url(
-                        f'A{row}', row_sheet["link_of_text"], self.summary_link_format, string=row_sheet["text_col"])   # noqa pylint: disable=C0301
+                        row-1, col, row_sheet["link_of_text"], summary_link_format, string=row_sheet["text_col"])   # noqa pylint: disable=C0301
                 else:
                     qualification_summary_sheet.write(
-                        row-1, col, row_sheet["text_col"], self.summary_format)
+                        row-1, col, row_sheet["text_col"], summary_format)
 
                 qualification_summary_sheet.write_formula(
-                    f'B{row}', row_sheet["result_col"], cell_format=self.summary_format)  # noqa
-
-                qualification_summary_sheet.conditional_format(f'B{row}:B{row}', {  # noqa
-                    'type': 'text',
-                    'criteria': 'containing',
-                    'value': 'PASSED',
-                    'format': self.summary_cell_green_format
-                })
-                qualification_summary_sheet.conditional_format(f'B{row}:B{row}', {  # noqa
-                    'type': 'text',
-                    'criteria': 'containing',
-                    'value': 'FAILED',
-                    'format': self.summary_cell_danger_format
-                })
+                    row-1, col+1, row_sheet["result_col"], cell_format=summary_format)  # noqa
+
+                qualification_summary_sheet.conditional_format(
+                    row-1, col+1, row-1, col+1, passed_format)
+                qualification_summary_sheet.conditional_format(
+                    row-1, col+1, row-1, col+1, failed_format)
                 row = row+1
 
         self.summary_note_blue_format.set_text_wrap()
@@ -1142,10 +1181,10 @@ class QualificationReport():  # noqa pylint: disable=R0902,R0904
         for note in report_summary["note_list"]["notes"]:
             if note["bg_color"] == "blue":
                 qualification_summary_sheet.merge_range(
-                    f'A{row}:B{row}', note["text"], self.summary_note_blue_format)  # noqa
+                    row-1, col, row-1, col+1, note["text"], self.summary_note_blue_format)  # noqa
             else:
                 qualification_summary_sheet.merge_range(
-                    f'A{row}:B{row}', note["text"], self.summary_note_green_format)  # noqa
+                    row-1, col, row-1, col+1, note["text"], self.summary_note_green_format)  # noqa
             row = row+1
 
     def reverse_sheets(self):
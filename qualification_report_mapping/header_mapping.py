@@ -16,51 +16,58 @@
 
 """Loads mappings for the qualification report from JSON files.
 
-This module parses various JSON files containing mappings
-and data used to generate the qualification report. The parsed data
-is stored in individual variables, making it accessible for
-report generation. The `parse_json` utility function is used for
-parsing the JSON data.
+This module exposes the mappings and data used to generate the
+qualification report as module attributes. Each JSON file is parsed
+with the `parse_json` utility the first time its attribute is accessed
+(PEP 562), so importing the module does no file I/O.
 """
 
 from utils import parse_json  # pylint: disable=E0401
 
+_MAPPING_DIR = "./qualification_report_mapping_json"
 
-topology_installation_mapping = parse_json(
-    "./qualification_report_mapping_json/topology_installation_mapping.json")
-anti_patterns_mapping = parse_json(
-    "./qualification_report_mapping_json/anti_patterns.json")
-api_limits_mapping = parse_json(
-    "./qualification_report_mapping_json/api_limits.json")
-api_with_multiple_basepath_mapping = parse_json(
-    "./qualification_report_mapping_json/api_with_multiple_basepath.json")
-apps_without_api_products_mapping = parse_json(
-    "./qualification_report_mapping_json/apps_without_api_products.json")
-cache_without_expiry_mapping = parse_json(
-    "./qualification_report_mapping_json/cache_without_expiry.json")
-cname_anomaly_mapping = parse_json(
-    "./qualification_report_mapping_json/cname_anomaly.json")
-company_and_developers_mapping = parse_json(
-    "./qualification_report_mapping_json/company_and_developers.json")
-env_limits_mapping = parse_json(
-    "./qualification_report_mapping_json/env_limits.json")
-json_path_enabled_mapping = parse_json(
-    "./qualification_report_mapping_json/json_path_enabled.json")
-northbound_mtls_mapping = parse_json(
-    "./qualification_report_mapping_json/northbound_mtls.json")
-org_limits_mapping = parse_json(
-    "./qualification_report_mapping_json/org_limits.json")
-proxies_per_env_mapping = parse_json(
-    "./qualification_report_mapping_json/proxies_per_env.json")
-unsupported_polices_mapping = parse_json(
-    "./qualification_report_mapping_json/unsupported_policies.json")
-sharding_output = parse_json(
-    "./qualification_report_mapping_json/target_environments.json")
-aliases_with_private_keys = parse_json(
-    "./qualification_report_mapping_json/aliases_with_private_keys.json")
-sharded_proxies = parse_json(
-    "./qualification_report_mapping_json/sharded_proxies.json")
-org_resourcefiles = parse_json(
-    "./qualification_report_mapping_json/org_resourcefiles.json")
-validation_report = parse_json(
-    "./qualification_report_mapping_json/validation_report.json")
+_MAPPINGS = {
+    'topology_installation_mapping': 'topology_installation_mapping.json',
+    'anti_patterns_mapping': 'anti_patterns.json',
+    'api_limits_mapping': 'api_limits.json',
+    'api_with_multiple_basepath_mapping': 'api_with_multiple_basepath.json',
+    'apps_without_api_products_mapping': 'apps_without_api_products.json',
+    'cache_without_expiry_mapping': 'cache_without_expiry.json',
+    'cname_anomaly_mapping': 'cname_anomaly.json',
+    'company_and_developers_mapping': 'company_and_developers.json',
+    'env_limits_mapping': 'env_limits.json',
+    'json_path_enabled_mapping': 'json_path_enabled.json',
+    'northbound_mtls_mapping': 'northbound_mtls.json',
+    'org_limits_mapping': 'org_limits.json',
+    'proxies_per_env_mapping': 'proxies_per_env.json',
+    'unsupported_polices_mapping': 'unsupported_policies.json',
+    'sharding_output': 'target_environments.json',
+    'aliases_with_private_keys': 'aliases_with_private_keys.json',
+    'sharded_proxies': 'sharded_proxies.json',
+    'org_resourcefiles': 'org_resourcefiles.json',
+    'validation_report': 'validation_report.json',
+}
+
+
+def __getattr__(name):
+    """Parses and caches a mapping on first access.
+
+    Args:
+        name (str): The mapping attribute being looked up.
+
+    Returns:
+        dict: The parsed JSON mapping.
+
+    Raises:
+        AttributeError: If `name` is not a known mapping.
+    """
+    if name not in _MAPPINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = parse_json(f"{_MAPPING_DIR}/{_MAPPINGS[name]}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Lists the module attributes, including not-yet-loaded mappings."""
+    return sorted(set(globals()) | set(_MAPPINGS))
@@ -16,13 +16,30 @@
 
 """Loads the report summary mapping from a JSON file.
 
-This module parses the `report_summary.json` file and stores the mapping
-in the `report_summary` variable.  The `parse_json` utility function
-is used to perform the parsing.
+This module exposes the `report_summary.json` mapping as the
+`report_summary` attribute. The file is parsed with the `parse_json`
+utility on first access (PEP 562) rather than at import time.
 """
 
 
 from utils import parse_json  # pylint: disable=E0401
 
-report_summary = parse_json(
-    "./qualification_report_mapping_json/report_summary.json")
+
+def __getattr__(name):
+    """Parses and caches the report summary on first access.
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Returns:
+        dict: The parsed report summary mapping.
+
+    Raises:
+        AttributeError: If `name` is not `report_summary`.
+    """
+    if name != 'report_summary':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = parse_json(
+        "./qualification_report_mapping_json/report_summary.json")
+    globals()[name] = value
+    return value
@@ -28,21 +28,116 @@ low-level request details and providing a
 Pythonic interface.
 """
 
+import asyncio
+import concurrent.futures
+import contextlib
+import importlib.util
 import json
+import logging
+import os
+import socket
 import requests  # pylint: disable=E0401
+from requests.adapters import HTTPAdapter  # pylint: disable=E0401
+from urllib3.connection import HTTPConnection  # pylint: disable=E0401
 from urllib3.exceptions import InsecureRequestWarning  # pylint: disable=E0401
+from urllib3.util.retry import Retry  # pylint: disable=E0401
 from base_logger import logger, EXEC_INFO
 
+try:
+    import aiohttp  # pylint: disable=E0401
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson  # pylint: disable=E0401
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # pylint: disable=E0401
+except ImportError:
+    httpx = None
+
 # Suppress the warnings from urllib3
 requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)   # noqa pylint: disable=E1101
 
 UNKNOWN_ERROR = 'internal.unknown'
 
+# Transient statuses retried on idempotent methods (Retry-After is honoured)
+RETRY_STATUSES = (429, 502, 503, 504)
+
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Statuses that never carry a body
+NO_CONTENT_STATUSES = (204, 205)
+
+# Keys checked, in order, for the error code and message of a JSON
+# error payload
+ERROR_CODE_KEYS = ('errorCode', 'error')
+ERROR_MESSAGE_KEYS = ('message', 'error')
+
+# Longest response body prefix written to the debug log
+LOG_BODY_LIMIT = 1024
+
+# urllib3's defaults (TCP_NODELAY) plus keep-alive probes so idle pooled
+# connections are not silently dropped by NATs and load balancers
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+def _log_response(response):
+    """Logs a response body prefix when DEBUG logging is enabled.
+
+    Args:
+        response: The HTTP response object.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Response: %s %r", response.status_code,
+                     response.content[:LOG_BODY_LIMIT])
+
+
+def _dumps(obj):
+    """Serializes a request body to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed, falling back to the
+    standard library encoder.
+
+    Args:
+        obj: The JSON-serializable request body.
+
+    Returns:
+        bytes: The encoded body.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(content):
+    """Parses a JSON response body straight from bytes.
+
+    Uses orjson when it is installed, falling back to the
+    standard library parser. Both raise a ValueError subclass
+    on malformed input.
+
+    Args:
+        content (bytes): The raw response body.
+
+    Returns:
+        The decoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 
 class ApigeeError(Exception):
     """Represents an error during interaction with
     the Apigee management API.
     """
+    __slots__ = ('status_code', 'error_code', 'message')
+
     def __init__(self, status_code, error_code, message):
         """Initializes an ApigeeError.
 
@@ -65,6 +160,24 @@ class ApigeeError(Exception):
         return f'{self.status_code}: {self.message}'
 
 
+class TunedAdapter(HTTPAdapter):  # noqa pylint: disable=R0903
+    """An `HTTPAdapter` that applies `SOCKET_OPTIONS` to new connections.
+
+    Long scans keep a small number of pooled connections alive
+    instead of opening (and leaving in TIME_WAIT) one per request.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Creates the pool manager with `SOCKET_OPTIONS` set."""
+        kwargs.setdefault('socket_options', SOCKET_OPTIONS)
+        return super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        """Creates a proxy manager with `SOCKET_OPTIONS` set."""
+        proxy_kwargs.setdefault('socket_options', SOCKET_OPTIONS)
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
 class RestClient(object):  # noqa pylint: disable=R0205
     """A client for making HTTP requests to RESTful
     APIs, especially Apigee.
@@ -84,24 +197,61 @@ class RestClient(object):  # noqa pylint: disable=R0205
             (Basic auth credentials or OAuth2 token).
         ssl_verify (bool): Whether to verify SSL
             certificates (default: True).
-        session (requests.Session): The underlying
-            requests session object.
-        base_headers (dict): Default headers for
-            all requests.
+        pool_maxsize (int): Connections kept alive
+            per host (default: 64).
+        backend (str): The HTTP library, 'requests'
+            (default) or 'httpx'. httpx negotiates
+            HTTP/2 when the h2 package is installed,
+            multiplexing concurrent calls over one
+            connection per host.
+        session (requests.Session or httpx.Client): The
+            underlying session object. It carries the
+            Authorization header for every request.
     """
 
-    def __init__(self, auth_type, token, ssl_verify=True):
+    def __init__(self, auth_type, token, ssl_verify=True,  # noqa pylint: disable=R0913,R0917
+                 pool_maxsize=64, backend='requests'):
         self._allowed_auth_types = ['basic', 'oauth']
-        self.session = requests.Session()
-        self.session.verify = ssl_verify
+        if backend == 'httpx':
+            self.session = _httpx_session(ssl_verify, pool_maxsize)
+        elif backend == 'requests':
+            self.session = requests.Session()
+            self.session.verify = ssl_verify
+            retry = Retry(total=5, backoff_factor=0.2,
+                          status_forcelist=RETRY_STATUSES,
+                          raise_on_status=False)
+            adapter = TunedAdapter(pool_connections=pool_maxsize,
+                                   pool_maxsize=pool_maxsize,
+                                   max_retries=retry)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+        else:
+            raise ValueError(
+                f'Unknown backend {backend}, Allowed backends are requests ,httpx')   # noqa pylint: disable=C0301
+        self.backend = backend
+        self.ssl_verify = ssl_verify
         if auth_type not in self._allowed_auth_types:
             raise ValueError(
                 f'Unknown Auth type , Allowed types are {" ,".join(self._allowed_auth_types)}')   # noqa pylint: disable=C0301
         self.auth_type = auth_type
+        self.set_token(token)
 
-        self.base_headers = {
-            'Authorization': f'Basic {token}' if auth_type == 'basic' else f'Bearer {token}'   # noqa pylint: disable=C0301
-        }
+    def set_token(self, token):
+        """Replaces the credentials sent with every request.
+
+        The session and its pooled connections are kept, so
+        callers refreshing an OAuth token should use this rather
+        than constructing a new client.
+
+        Args:
+            token (str): The new Basic credentials or OAuth2 token.
+        """
+        self.token = token
+        auth = f'Basic {token}' if self.auth_type == 'basic' else f'Bearer {token}'   # noqa pylint: disable=C0301
+        if self.backend == 'requests':
+            # Pre-encoded so http.client does not re-encode it on every send
+            auth = auth.encode('latin-1')
+        self.session.headers['Authorization'] = auth
 
     def get(self, url, params=None):
         """Makes a GET request.
@@ -117,14 +267,90 @@ class RestClient(object):  # noqa pylint: disable=R0205
             ApigeeError: If the API request returns
                 an error.
         """
-        headers = self.base_headers.copy()
-        response = self.session.get(url, params=params, headers=headers)
-        logger.debug(f"Response: {response.content}")  # noqa pylint: disable=W1203
+        response = self._send('GET', url, params=params)
+        _log_response(response)
         return self._process_response(response)
 
+    def batch_get(self, urls, max_concurrency=32, backend=None):
+        """Makes many GET requests concurrently.
+
+        By default the requests are spread over a thread pool
+        sharing this client's session (see `map_get`), so they
+        get the same retries, pooling and backend as `get`.
+
+        Passing backend='aiohttp' issues them from a short-lived
+        `AsyncRestClient` on a private event loop instead, when
+        aiohttp is installed and no event loop is running. That
+        client does not retry 429/5xx responses and does not use
+        this client's pool or socket settings, so a URL list that
+        succeeds here after a retry can fail on the aiohttp path.
+
+        Args:
+            urls (iterable): The URLs to fetch.
+            max_concurrency (int, optional): Maximum requests
+                in flight at once.
+            backend (str, optional): 'aiohttp' to opt in to
+                the asyncio path; defaults to this client's
+                backend.
+
+        Returns:
+            list: The response contents, in the order of `urls`.
+
+        Raises:
+            ApigeeError: If any request returns an error.
+        """
+        urls = list(urls)
+        if (backend == 'aiohttp' and aiohttp is not None
+                and not _in_event_loop()):
+            return asyncio.run(self._async_batch_get(urls, max_concurrency))
+        return self.map_get(urls, workers=max_concurrency)
+
+    def map_get(self, urls, workers=16):
+        """Makes GET requests for `urls` from a thread pool.
+
+        requests and httpx release the GIL while waiting on the
+        socket, so round-trip-bound calls overlap almost linearly
+        up to `workers`. All threads share this client's pooled
+        session; keep `workers` at or below `pool_maxsize` so
+        they do not wait on each other for a connection. Prefer
+        this over `for url in urls: client.get(url)`.
+
+        Args:
+            urls (iterable): The URLs to fetch.
+            workers (int, optional): Number of threads.
+
+        Returns:
+            list: The response contents, in the order of `urls`.
+
+        Raises:
+            ApigeeError: If any request returns an error.
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers) as executor:
+            return list(executor.map(self.get, urls))
+
+    async def _async_batch_get(self, urls, max_concurrency):
+        """Fetches `urls` with a short-lived `AsyncRestClient`.
+
+        Args:
+            urls (list): The URLs to fetch.
+            max_concurrency (int): Maximum requests in flight.
+
+        Returns:
+            list: The response contents, in input order.
+        """
+        async with AsyncRestClient(self.auth_type, self.token,
+                                   self.ssl_verify,
+                                   pool_maxsize=max_concurrency,
+                                   max_concurrency=max_concurrency) as client:
+            return await asyncio.gather(*(client.get(url) for url in urls))
+
     def file_get(self, url, params=None):
         """Makes a GET request for file download.
 
+        The whole body is loaded into memory; use `file_get_to`
+        to stream large downloads to disk instead.
+
         Args:
             url (str): The URL.
             params (dict, optional): Query parameters.
@@ -135,11 +361,59 @@ class RestClient(object):  # noqa pylint: disable=R0205
         Raises:
             ApigeeError: If an error occurs.
         """
-        headers = self.base_headers.copy()
-        response = self.session.get(
-            url, params=params, headers=headers, stream=True)
-        logger.debug(f"Response: {response.content}")  # noqa pylint: disable=W1203
-        return self._process_response(response)
+        with contextlib.closing(
+                self._send('GET', url, params=params)) as response:
+            logger.debug("Response: %s bytes",
+                         response.headers.get('Content-Length', '<stream>'))
+            return self._process_response(response)
+
+    def file_get_to(self, url, dest, params=None, chunk_size=65536):
+        """Streams a GET response body straight to a file.
+
+        Unlike `file_get`, the body is never held in memory as a
+        whole; it is copied to disk `chunk_size` bytes at a time.
+        The data is written to `<dest>.part` and renamed into
+        place once complete, so a failed download never leaves a
+        truncated file at `dest`.
+
+        Args:
+            url (str): The URL.
+            dest (str): The path of the file to write.
+            params (dict, optional): Query parameters.
+            chunk_size (int, optional): Bytes per read.
+
+        Returns:
+            int: The number of bytes written.
+
+        Raises:
+            ApigeeError: If the API returns an error status.
+        """
+        part = f'{dest}.part'
+        written = 0
+        response = self._send('GET', url, params=params, stream=True)
+        with contextlib.closing(response):
+            if response.status_code >= 400:
+                if self.backend == 'httpx':
+                    response.read()
+                raise ApigeeError(status_code=response.status_code,
+                                  error_code=UNKNOWN_ERROR,
+                                  message=response.text)
+            if self.backend == 'httpx':
+                chunks = response.iter_bytes(chunk_size)
+            else:
+                chunks = response.iter_content(chunk_size)
+            try:
+                with open(part, 'wb') as fl:
+                    for chunk in chunks:
+                        fl.write(chunk)
+                        written += len(chunk)
+            except BaseException:
+                if os.path.exists(part):
+                    os.remove(part)
+                raise
+        os.replace(part, dest)
+        logger.debug("Response: %d bytes written to %s", written, dest)
+        return written
 
     def post(self, url, data=None):
         """Makes a POST request.
@@ -154,10 +428,9 @@ class RestClient(object):  # noqa pylint: disable=R0205
         Raises:
             ApigeeError: If an error occurs.
         """
-        headers = self.base_headers.copy()
-        response = self.session.post(
-            url, data=json.dumps(data or {}), headers=headers)
-        logger.debug(f"Response: {response.content}")  # noqa pylint: disable=W1203
+        response = self._send(
+            'POST', url, data=_dumps(data or {}), headers=JSON_HEADERS)
+        _log_response(response)
         return self._process_response(response)
 
     def file_post(self, url, params=None, data=None, files=None):
@@ -176,12 +449,12 @@ class RestClient(object):  # noqa pylint: disable=R0205
             ApigeeError: If an error occurs.
 
         """
-        headers = self.base_headers.copy()
-        headers['Content-Type'] = 'application/octet-stream'
-        response = self.session.post(
-            url, data=data, files=files, headers=headers, params=params)
-        logger.debug(f"Response: {response.content}")  # noqa pylint: disable=W1203
-        return self._process_response(response)
+        headers = {'Content-Type': 'application/octet-stream'}
+        with contextlib.closing(
+                self._send('POST', url, data=data, files=files,
+                           headers=headers, params=params)) as response:
+            _log_response(response)
+            return self._process_response(response)
 
     def patch(self, url, data=None):
         """Makes a PATCH request.
@@ -196,10 +469,9 @@ class RestClient(object):  # noqa pylint: disable=R0205
         Raises:
             ApigeeError:  If an error occurs.
         """
-        headers = self.base_headers.copy()
-        response = self.session.patch(
-            url, data=json.dumps(data or {}), headers=headers)
-        logger.debug(f"Response: {response.content}")  # noqa pylint: disable=W1203
+        response = self._send(
+            'PATCH', url, data=_dumps(data or {}), headers=JSON_HEADERS)
+        _log_response(response)
         return self._process_response(response)
 
     def put(self, url, data=None):
@@ -215,10 +487,9 @@ class RestClient(object):  # noqa pylint: disable=R0205
         Raises:
             ApigeeError: If an error occurs.
         """
-        headers = self.base_headers.copy()
-        response = self.session.put(
-            url, data=json.dumps(data or {}), headers=headers)
-        logger.debug(f"Response: {response.content}")  # noqa pylint: disable=W1203
+        response = self._send(
+            'PUT', url, data=_dumps(data or {}), headers=JSON_HEADERS)
+        _log_response(response)
         return self._process_response(response)
 
     def delete(self, url, params=None):
@@ -234,11 +505,36 @@ class RestClient(object):  # noqa pylint: disable=R0205
         Raises:
             ApigeeError: If an error occurs.
         """
-        headers = self.base_headers.copy()
-        response = self.session.delete(url, headers=headers, params=params or {})     # noqa pylint: disable=C0301
-        logger.debug(f"Response: {response.content}")  # noqa pylint: disable=W1203
+        response = self._send('DELETE', url, params=params or {})
+        _log_response(response)
         return self._process_response(response)
 
+    def _send(self, method, url, stream=False, **kwargs):
+        """Sends a request through the configured backend.
+
+        Smooths over the few places where httpx differs from
+        `requests`: raw bytes bodies go in `content`, query
+        params are encoded the way `requests` encodes them, and
+        streaming is requested on `send` rather than per verb.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL.
+            stream (bool, optional): Leave the body unread.
+            **kwargs: `requests`-style request arguments
+                (params, data, files, headers).
+
+        Returns:
+            The backend's response object.
+        """
+        if self.backend == 'httpx':
+            if isinstance(kwargs.get('data'), bytes):
+                kwargs['content'] = kwargs.pop('data')
+            kwargs['params'] = _query_params(kwargs.get('params'))
+            request = self.session.build_request(method, url, **kwargs)
+            return self.session.send(request, stream=stream)
+        return self.session.request(method, url, stream=stream, **kwargs)
+
     def _process_response(self, response):
         """Processes the response from an HTTP request.
 
@@ -248,7 +544,7 @@ class RestClient(object):  # noqa pylint: disable=R0205
         Returns:
             The content of the response.
         """
-        return self._parse(response).content()
+        return _response_content(response)
 
     def _parse(self, response):
         """Parses the response content based on content type.
@@ -260,18 +556,427 @@ class RestClient(object):  # noqa pylint: disable=R0205
             A Response object (JsonResponse, PlainResponse,
             EmptyResponse, or RawResponse).
         """
-        if not response.text:
-            return EmptyResponse(response.status_code)
+        return _parse_response(response)
+
+
+class AsyncRestClient(object):  # noqa pylint: disable=R0205
+    """An asyncio counterpart of `RestClient` built on aiohttp.
+
+    A single `aiohttp.ClientSession` is opened for the lifetime of the
+    client so that concurrent calls issued with `asyncio.gather` share
+    pooled keep-alive connections. The number of requests in flight is
+    capped by a semaphore. Responses are parsed into the same `Response`
+    classes as the synchronous client and return the same content.
+
+    Use it as an async context manager::
+
+        async with AsyncRestClient('oauth', token) as client:
+            results = await asyncio.gather(*(client.get(u) for u in urls))
+
+    Attributes:
+        auth_type (str): The authentication type
+            ('basic' or 'oauth').
+        ssl_verify (bool): Whether to verify SSL
+            certificates (default: True).
+        pool_maxsize (int): Maximum pooled connections
+            (default: 64).
+        max_concurrency (int): Maximum requests in
+            flight at once (default: 64).
+    """
+
+    def __init__(self, auth_type, token, ssl_verify=True,  # noqa pylint: disable=R0913,R0917
+                 pool_maxsize=64, max_concurrency=64):
+        if aiohttp is None:
+            raise ImportError(
+                'AsyncRestClient requires the aiohttp package')
+        if auth_type not in ('basic', 'oauth'):
+            raise ValueError(
+                'Unknown Auth type , Allowed types are basic ,oauth')
+        self.auth_type = auth_type
+        self.ssl_verify = ssl_verify
+        self.pool_maxsize = pool_maxsize
+        self.max_concurrency = max_concurrency
+        self._headers = {}
+        self._session = None
+        self._semaphore = None
+        self.set_token(token)
+
+    def set_token(self, token):
+        """Replaces the credentials sent with every request.
+
+        Takes effect immediately on an open session, keeping its
+        pooled connections.
+
+        Args:
+            token (str): The new Basic credentials or OAuth2 token.
+        """
+        self._headers['Authorization'] = (
+            f'Basic {token}' if self.auth_type == 'basic' else f'Bearer {token}')   # noqa pylint: disable=C0301
+        if self._session is not None:
+            self._session.headers['Authorization'] = (
+                self._headers['Authorization'])
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_maxsize, ssl=self.ssl_verify)
+        self._session = aiohttp.ClientSession(
+            connector=connector, headers=self._headers)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Closes the underlying session and its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get(self, url, params=None):
+        """Makes a GET request.
+
+        Args:
+            url (str): The URL to send the request to.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            The response content.
+
+        Raises:
+            ApigeeError: If the API request returns
+                an error.
+        """
+        return await self._request('GET', url, params=params)
+
+    async def file_get(self, url, params=None):
+        """Makes a GET request for file download.
+
+        Args:
+            url (str): The URL.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            The raw response content.
+
+        Raises:
+            ApigeeError: If an error occurs.
+        """
+        return await self._request('GET', url, params=params)
+
+    async def post(self, url, data=None):
+        """Makes a POST request.
+
+        Args:
+            url (str): The URL.
+            data (dict, optional): Request body data.
+
+        Returns:
+            The response content.
+
+        Raises:
+            ApigeeError: If an error occurs.
+        """
+        return await self._request(
+            'POST', url, data=_dumps(data or {}), headers=JSON_HEADERS)
+
+    async def file_post(self, url, params=None, data=None, files=None):
+        """Makes a file upload POST request.
+
+        Args:
+            url (str): The URL.
+            params (dict, optional): Query params.
+            data (dict, optional):  Request body.
+            files (list, optional): Files to upload, as
+                (field, (filename, fileobj, content_type))
+                tuples like `requests` accepts.
+
+        Returns:
+            The response content.
+
+        Raises:
+            ApigeeError: If an error occurs.
+        """
+        if files:
+            form = aiohttp.FormData()
+            for key, value in (data or {}).items():
+                form.add_field(key, str(value))
+            for field, (filename, fileobj, content_type) in files:
+                form.add_field(field, fileobj, filename=filename,
+                               content_type=content_type)
+            data = form
+        headers = {'Content-Type': 'application/octet-stream'}
+        return await self._request('POST', url, params=params, data=data,
+                                   headers=headers)
+
+    async def patch(self, url, data=None):
+        """Makes a PATCH request.
+
+        Args:
+            url (str): The URL.
+            data (dict, optional): Request body data.
+
+        Returns:
+            The response content.
+
+        Raises:
+            ApigeeError:  If an error occurs.
+        """
+        return await self._request(
+            'PATCH', url, data=_dumps(data or {}), headers=JSON_HEADERS)
+
+    async def put(self, url, data=None):
+        """Makes a PUT request.
+
+        Args:
+            url (str): The URL.
+            data (dict, optional): The request body.
+
+        Returns:
+            The response content.
+
+        Raises:
+            ApigeeError: If an error occurs.
+        """
+        return await self._request(
+            'PUT', url, data=_dumps(data or {}), headers=JSON_HEADERS)
+
+    async def delete(self, url, params=None):
+        """Makes a DELETE request.
+
+        Args:
+            url (str): The URL.
+            params (dict, optional): Query parameters.
+
+        Returns:
+            The response content.
+
+        Raises:
+            ApigeeError: If an error occurs.
+        """
+        return await self._request('DELETE', url, params=params)
+
+    async def _request(self, method, url, params=None, **kwargs):
+        """Sends a request and parses the response.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL.
+            params (dict, optional): Query parameters.
+            **kwargs: Extra arguments for `ClientSession.request`.
+
+        Returns:
+            The response content.
+
+        Raises:
+            ApigeeError: If an error occurs.
+        """
+        if self._session is None:
+            raise RuntimeError(
+                'AsyncRestClient must be used as an async context manager')
+        async with self._semaphore:
+            async with self._session.request(
+                    method, url, params=_query_params(params),
+                    **kwargs) as resp:
+                body = await resp.read()
+                response = _AsyncResponse(
+                    resp.status, resp.headers, body, resp.charset)
+        _log_response(response)
+        return _response_content(response)
+
+
+class _AsyncResponse(object):  # noqa pylint: disable=R0205,R0903
+    """Adapts a fully read aiohttp response to the attributes
+    the `Response` classes read from a `requests.Response`.
+
+    Attributes:
+        status_code (int): The HTTP status code.
+        headers: The response headers.
+        content (bytes): The response body.
+        encoding (str): The declared charset, or None.
+    """
+    __slots__ = ('status_code', 'headers', 'content', 'encoding')
+
+    def __init__(self, status_code, headers, content, encoding=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self):
+        """str: The body decoded with the declared charset."""
+        return _decode_text(self)
+
+
+def _in_event_loop():
+    """Checks whether the caller is running inside an event loop.
+
+    Returns:
+        bool: True if `asyncio.run` cannot be used here.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _httpx_session(ssl_verify, pool_maxsize):
+    """Builds an httpx client configured like the `requests` session.
+
+    Redirects are followed and no timeout is applied, matching
+    `requests` defaults; connection failures are retried.
+
+    Args:
+        ssl_verify (bool): Whether to verify SSL certificates.
+        pool_maxsize (int): Maximum pooled connections.
+
+    Returns:
+        httpx.Client: The client.
+
+    Raises:
+        ImportError: If httpx is not installed.
+    """
+    if httpx is None:
+        raise ImportError("The 'httpx' backend requires the httpx package")
+    http2 = importlib.util.find_spec('h2') is not None
+    limits = httpx.Limits(max_connections=pool_maxsize,
+                          max_keepalive_connections=pool_maxsize)
+    transport = httpx.HTTPTransport(verify=ssl_verify, http2=http2,
+                                    limits=limits, retries=3,
+                                    socket_options=SOCKET_OPTIONS)
+    return httpx.Client(transport=transport, follow_redirects=True,
+                        timeout=None)
+
+
+def _query_params(params):
+    """Normalizes query params the way `requests` encodes them.
+
+    aiohttp only accepts str, int and float values, whereas `requests`
+    drops None values and renders booleans as 'True'/'False'.
+
+    Args:
+        params (dict): Query parameters, or None.
+
+    Returns:
+        dict: Parameters aiohttp can encode, or None.
+    """
+    if not params:
+        return None
+    return {key: str(value) if isinstance(value, bool) else value
+            for key, value in params.items() if value is not None}
+
+
+def _media_type(response):
+    """Returns the response media type without parameters.
+
+    Args:
+        response: The HTTP response object.
+
+    Returns:
+        str: e.g. 'application/json' for
+            'application/json; charset=UTF-8', or ''.
+    """
+    content_type = response.headers.get('Content-Type', '')
+    return content_type.split(';', 1)[0].strip().lower()
+
+
+def _is_json(media_type):
+    """Checks whether a media type carries a JSON body.
+
+    Args:
+        media_type (str): A media type from `_media_type`.
+
+    Returns:
+        bool: True for application/json and +json types.
+    """
+    return media_type == 'application/json' or media_type.endswith('+json')
+
+
+def _decode_text(response):
+    """Decodes a response body with its declared charset.
+
+    Unlike `requests.Response.text`, a missing charset falls back to
+    UTF-8 instead of running charset detection over the body.
+
+    Args:
+        response: The HTTP response object.
+
+    Returns:
+        str: The decoded body; undecodable bytes are replaced.
+    """
+    try:
+        return response.content.decode(response.encoding or 'utf-8',
+                                       'replace')
+    except LookupError:
+        return response.content.decode('utf-8', 'replace')
+
+
+def _response_content(response):
+    """Decodes a response body based on content type.
+
+    Returns the same value as `_parse_response(response).content()`,
+    but only builds a `Response` object on the error path; a
+    successful response is decoded in place.
+
+    Args:
+        response: The HTTP response object.
+
+    Returns:
+        The parsed JSON document, raw bytes for octet-stream
+        bodies, text otherwise, or '' for an empty body.
+
+    Raises:
+        ApigeeError: If the response represents an error.
+    """
+    status_code = response.status_code
+    if status_code is None:
+        return _parse_response(response).content()
+    content = response.content
+    if status_code in NO_CONTENT_STATUSES or not content:
+        return ''
+    media_type = _media_type(response)
+    if media_type == 'application/octet-stream':
+        return content
+    if _is_json(media_type):
+        try:
+            return _loads(content)
+        except ValueError:
+            logger.error('Unable to parse response as JSON',
+                         exc_info=EXEC_INFO)
+    return _decode_text(response)
+
+
+def _parse_response(response):
+    """Parses the response content based on content type.
+
+    The request methods decode successful responses through
+    `_response_content`; this remains for callers that want a
+    `Response` object.
+
+    Args:
+        response: The HTTP response object, or any object
+            exposing `status_code`, `headers`, `content`
+            and `encoding` like `requests.Response` does.
+
+    Returns:
+        A Response object (JsonResponse, PlainResponse,
+        EmptyResponse, or RawResponse).
+    """
+    if response.status_code in NO_CONTENT_STATUSES or not response.content:
+        return EmptyResponse(response.status_code)
+    media_type = _media_type(response)
+    response_class = _CT_TO_RESPONSE.get(media_type)
+    if response_class is not None:
+        return response_class(response)
+    if _is_json(media_type):
         try:
-            if response.headers['Content-Type'] == 'application/octet-stream':
-                return RawResponse(response)
-            if response.headers['Content-Type'].startswith('application/json'):
-                return JsonResponse(response)
-            return PlainResponse(response)
+            return JsonResponse(response)
         except ValueError:
             logger.error('Unable to parse response as JSON',
                          exc_info=EXEC_INFO)
-            return ""
+    return PlainResponse(response.status_code, _decode_text(response))
 
 
 class Response(object):  # noqa pylint: disable=R0205,R0903
@@ -286,6 +991,8 @@ class Response(object):  # noqa pylint: disable=R0205,R0903
         _status_code (int): The HTTP status code.
         _content: The response content.
     """
+    __slots__ = ('_status_code', '_content')
+
     def __init__(self, status_code, content):
         """Initializes a Response object.
 
@@ -351,45 +1058,64 @@ class JsonResponse(Response):  # noqa pylint: disable=R0903
     including error checking. Inherits from
     the `Response` base class.
     """
+    __slots__ = ()
+
     def __init__(self, response):
         """Initializes a JsonResponse.
 
         Args:
             response: The HTTP response object.
         """
-        content = json.loads(response.text)
+        content = _loads(response.content)
         super(JsonResponse, self).__init__(response.status_code, content)   # noqa pylint: disable=R1725
 
     def _error_code(self):
         """Returns the JSON error code.
 
-        Checks various keys for the error code
-        in the JSON content.
+        Checks `ERROR_CODE_KEYS` in order, also looking inside
+        Google API error envelopes
+        (`{"error": {"code": ..., "message": ...}}`).
 
         Returns:
             str: The error code, or a default
                 if not found.
         """
-
-        if 'errorCode' in self._content:
-            return self._content.get('errorCode')
-        if 'error' in self._content:
-            return self._content.get('error')
+        envelope = self._envelope()
+        if 'code' in envelope:
+            return envelope['code']
+        if isinstance(self._content, dict):
+            for key in ERROR_CODE_KEYS:
+                code = self._content.get(key)
+                if code is not None:
+                    return code
         return UNKNOWN_ERROR
 
     def _error_message(self):
         """Returns the JSON error message.
 
-        Extracts the error message from the
-        JSON content.
+        Checks `ERROR_MESSAGE_KEYS` in order, also looking
+        inside Google API error envelopes.
 
         Returns:
              str: The error message or an empty string.
         """
-        message = self._content.get('message', '')
-        if message is not None and message != '':
+        message = self._envelope().get('message')
+        if message:
             return message
-        return self._content.get('error', '')
+        if isinstance(self._content, dict):
+            for key in ERROR_MESSAGE_KEYS:
+                message = self._content.get(key)
+                if message:
+                    return message
+        return ''
+
+    def _envelope(self):
+        """Returns the nested `error` object, or an empty dict."""
+        if isinstance(self._content, dict):
+            error = self._content.get('error')
+            if isinstance(error, dict):
+                return error
+        return {}
 
 
 class PlainResponse(Response):  # noqa pylint: disable=R0903
@@ -398,14 +1124,16 @@ class PlainResponse(Response):  # noqa pylint: disable=R0903
     Handles plain text content. Inherits from
     the `Response` base class.
     """
-    def __init__(self, response):
+    __slots__ = ()
+
+    def __init__(self, status_code, text):
         """Initializes a PlainResponse.
 
         Args:
-            response: The HTTP response object.
+            status_code (int): The HTTP status code.
+            text (str): The decoded response body.
         """
-        super(PlainResponse, self).__init__(   # noqa pylint: disable=R1725
-            response.status_code, response.text)
+        super(PlainResponse, self).__init__(status_code, text)   # noqa pylint: disable=R1725
 
     def _error_code(self):
         """Returns the error code.
@@ -430,6 +1158,8 @@ class EmptyResponse(Response):  # noqa pylint: disable=R0903
     Handles responses with no content. Inherits
     from the `Response` base class.
     """
+    __slots__ = ()
+
     def __init__(self, status_code):
         """Initializes an EmptyResponse.
 
@@ -462,6 +1192,8 @@ class RawResponse(Response):  # noqa pylint: disable=R0903
     typically for file downloads. Inherits
     from the `Response` base class.
     """
+    __slots__ = ()
+
     def __init__(self, response):
         """Initializes a RawResponse.
 
@@ -486,3 +1218,9 @@ class RawResponse(Response):  # noqa pylint: disable=R0903
             bytes: The raw byte content as the error message. # noqa
         """
         return self._content
+
+
+# Media types decoded without a JSON parse attempt
+_CT_TO_RESPONSE = {
+    'application/octet-stream': RawResponse,
+}
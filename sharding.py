@@ -19,14 +19,29 @@ for Apigee proxies.
 """
 
 
+import collections
+import operator
 import os
 import zipfile
 import utils
 import unifier
-from base_logger import logger
+from base_logger import logger, EXEC_INFO
 
+# Policies that have no Apigee X / hybrid equivalent
+UNSUPPORTED_POLICIES = frozenset({
+    'OAuthV1', 'ConcurrentRatelimit', 'ConnectorCallout',
+    'StatisticsCollector', 'DeleteOAuthV1Info', 'GetOAuthV1Info', 'Ldap'})
 
-def qualification_report_info(each_proxy_dict):
+# Read buffer used when extracting proxy bundles
+EXTRACT_BUFFER_SIZE = 1 << 20
+
+# Configuration resolved once by `proxy_dependency_map` and passed
+# to every `proxy_dependency_map_parallel` task
+ProxyMapSettings = collections.namedtuple(
+    'ProxyMapSettings', ['proxy_endpoint_cnt', 'bundle_dir'])
+
+
+def qualification_report_info(each_proxy_dict, findings=None):
     """Generates a qualification report for a \
     given proxy.
 
@@ -39,93 +54,118 @@ def qualification_report_info(each_proxy_dict):
         each_proxy_dict (dict): A dictionary \
         containing the proxy's
             configuration details.
+        findings (dict, optional): Output of \
+            `policy_findings` for a set of policies \
+            that includes this proxy's. Unifier \
+            splits reuse the findings of the proxy \
+            they were split from. Computed from \
+            each_proxy_dict if omitted.
 
     Returns:
         dict: A dictionary containing the \
         qualification report.
     """
-    report = {}
-
-    report['policies'] = {}
-    report['JsonPathEnabled'] = {}
-    report['AntiPatternQuota'] = {}
-    report['CacheWithoutExpiry'] = {}
-    for policy, value in each_proxy_dict['Policies'].items():
-
-        # JSONPath Enabled
-        if list(value.keys())[0] == 'ExtractVariables':
-            jp_count = len(value['ExtractVariables'].get('JSONPayload', {}).get('Variable', {}))  # noqa pylint: disable=C0301
-            if jp_count > 0:
-                report['JsonPathEnabled'][policy] = jp_count
-
-        # Quota Policy Anti Pattern
-        if list(value.keys())[0] == 'Quota':
-            if (value['Quota'].get('Distributed', 'false') == 'false' or
-                    value['Quota'].get('Synchronous', 'false') == 'true'):
-                report['AntiPatternQuota'][policy] = {}
-                report['AntiPatternQuota'][policy]['distributed'] = value['Quota'].get('Distributed', None)  # noqa pylint: disable=C0301
-                report['AntiPatternQuota'][policy]['Synchronous'] = value['Quota'].get('Synchronous', None)  # noqa pylint: disable=C0301
-
-        # Unsupported Policies
-        unsupported_policies = ['OAuthV1', 'ConcurrentRatelimit',
-                                'ConnectorCallout', 'StatisticsCollector',
-                                'DeleteOAuthV1Info', 'GetOAuthV1Info',
-                                'Ldap']
-        if list(value.keys())[0] in unsupported_policies:
-            report['policies'][policy] = list(value.keys())[0]
-
-        # Cache without expiry
-        if list(value.keys())[0] == 'PopulateCache' or list(value.keys())[0] == 'ResponseCache':  # noqa pylint: disable=C0301
-            if not value[list(value.keys())[0]].get('ExpirySettings'):
-                report['CacheWithoutExpiry'][policy] = list(value.keys())[0]
+    if findings is None:
+        findings = policy_findings(each_proxy_dict['Policies'])
+    report = {
+        'policies': {},
+        'JsonPathEnabled': {},
+        'AntiPatternQuota': {},
+        'CacheWithoutExpiry': {},
+    }
+    for policy in each_proxy_dict['Policies']:
+        finding = findings.get(policy)
+        if finding is not None:
+            report[finding[0]][policy] = finding[1]
 
     # api with multiple basepaths
-    base_paths = []
-    for _, value in each_proxy_dict['ProxyEndpoints'].items():  # noqa pylint: disable=C0301
-        basepath = value['ProxyEndpoint']['HTTPProxyConnection']['BasePath']  # noqa pylint: disable=C0301
-        base_paths.append(basepath)
-    report['base_paths'] = base_paths
+    report['base_paths'] = [
+        value['ProxyEndpoint']['HTTPProxyConnection']['BasePath']
+        for value in each_proxy_dict['ProxyEndpoints'].values()]
 
     return report
 
 
-def unzip_all_bundles(input_cfg):
-    """Unzips all proxy bundles in the specified \
-    directory.
+def policy_findings(policies):
+    """Checks policies for qualification issues.
 
     Args:
-        input_cfg \
-        (configparser.ConfigParser): \
-        The input configuration.
+        policies (dict): Policies of a proxy, \
+        keyed by policy name.
+
+    Returns:
+        dict: (report section, detail) for each \
+        policy with an issue, keyed by policy name.
     """
-    backend_cfg = utils.parse_config('backend.properties')
-    export_dir_name = backend_cfg.get('export', 'EXPORT_DIR')
-    target_dir = input_cfg.get('inputs', 'TARGET_DIR')
-    source_unzipped_apis = backend_cfg.get('unifier', 'source_unzipped_apis')  # noqa pylint: disable=C0301
+    findings = {}
+    for policy, value in policies.items():
+        policy_type = next(iter(value))
+        check = POLICY_CHECKS.get(policy_type)
+        if check is not None:
+            finding = check(policy_type, value[policy_type])
+            if finding is not None:
+                findings[policy] = finding
+
+        # Unsupported Policies
+        elif policy_type in UNSUPPORTED_POLICIES:
+            findings[policy] = ('policies', policy_type)
+
+    return findings
+
+
+def _check_json_path(policy_type, policy_data):  # noqa pylint: disable=W0613
+    """Flags ExtractVariables policies that use JSONPath."""
+    json_payload = policy_data.get('JSONPayload') or {}
+    jp_count = len(json_payload.get('Variable', {}))
+    if jp_count > 0:
+        return ('JsonPathEnabled', jp_count)
+    return None
+
+
+def _check_quota(policy_type, policy_data):  # noqa pylint: disable=W0613
+    """Flags Quota policies that are not distributed or are synchronous."""
+    distributed = policy_data.get('Distributed')
+    synchronous = policy_data.get('Synchronous')
+    # an empty <Distributed/> parses to None and is not flagged
+    if (policy_data.get('Distributed', 'false') == 'false'
+            or synchronous == 'true'):
+        return ('AntiPatternQuota', {
+            'distributed': distributed,
+            'Synchronous': synchronous,
+        })
+    return None
 
-    extension = ".zip"
-    current_dir = os.getcwd()
-    unzip_dir_name = current_dir+'/'+target_dir + \
-        '/'+export_dir_name+source_unzipped_apis
 
-    if not os.path.isdir(unzip_dir_name):
-        os.makedirs(unzip_dir_name)  # create unzip directory
+def _check_cache(policy_type, policy_data):
+    """Flags cache policies without ExpirySettings."""
+    if not policy_data.get('ExpirySettings'):
+        return ('CacheWithoutExpiry', policy_type)
+    return None
 
-    # change directory from working dir to dir with files
-    os.chdir('./'+target_dir+'/'+export_dir_name+'/apis')
-    for item in os.listdir('./'):  # loop through items in dir
 
-        if item.endswith(extension):  # check for ".zip" extension
+# Qualification checks by policy type; each returns a
+# (report section, detail) pair, or None if the policy is fine
+POLICY_CHECKS = {
+    'ExtractVariables': _check_json_path,
+    'Quota': _check_quota,
+    'PopulateCache': _check_cache,
+    'ResponseCache': _check_cache,
+}
 
-            file_name = os.path.abspath(item)  # get full path of files
 
-            zip_ref = zipfile.ZipFile(file_name)  # create zipfile object  # noqa pylint: disable=R1732
+def _extract_bundle(file_name, dest_dir):
+    """Extracts one proxy bundle.
 
-            # extract file to dir
-            zip_ref.extractall(f"../{source_unzipped_apis}/{item[:-4]}/")
-            zip_ref.close()  # close file
+    The archive is read through a 1 MiB buffer, so large
+    bundles take far fewer read calls than with the default.
 
-    os.chdir(current_dir)  # revert to current directory
+    Args:
+        file_name (str): Absolute path of the zip file.
+        dest_dir (str): Absolute path to extract into.
+    """
+    with open(file_name, 'rb', buffering=EXTRACT_BUFFER_SIZE) as zip_file, \
+            zipfile.ZipFile(zip_file) as zip_ref:
+        zip_ref.extractall(dest_dir)  # extract file to dir
 
 
 def proxy_dependency_map(cfg, export_data):  # noqa pylint: disable=R0914
@@ -147,28 +187,38 @@ def proxy_dependency_map(cfg, export_data):  # noqa pylint: disable=R0914
         proxy dependency map.
     """
 
-    unzip_all_bundles(cfg)
-
-    input_cfg = utils.parse_config('input.properties')
-    backend_cfg = utils.parse_config('backend.properties')
+    backend_cfg = utils.parse_config_once('backend.properties')
     export_dir_name = backend_cfg.get('export', 'EXPORT_DIR')
-    target_dir = input_cfg.get('inputs', 'TARGET_DIR')
+    target_dir = cfg.get('inputs', 'TARGET_DIR')
     source_unzipped_apis = backend_cfg.get('unifier', 'source_unzipped_apis')  # noqa pylint: disable=C0301
 
     current_dir = os.getcwd()
     apis_dirs = current_dir+'/'+target_dir+'/'+export_dir_name+source_unzipped_apis  # noqa pylint: disable=C0301
+    os.makedirs(apis_dirs, exist_ok=True)  # create unzip directory
 
-    result = {}
-    proxy_dir = apis_dirs
-    proxy_dependency_map_data = {}
-    args = ((apiname, proxy_dir, proxy_dependency_map_data)
-            for apiname in export_data["orgConfig"]["apis"].keys())
+    # each task extracts its own bundle before parsing it, so
+    # extraction overlaps with the parsing done by other workers
+    settings = ProxyMapSettings(
+        proxy_endpoint_cnt=utils.get_proxy_endpoint_count(backend_cfg),
+        bundle_dir=os.path.join(current_dir, target_dir, export_dir_name,
+                                'apis'))
 
-    result = utils.run_parallel(proxy_dependency_map_parallel, args)
+    proxy_dir = apis_dirs
+    args = [(apiname, proxy_dir, settings)
+            for apiname in export_data["orgConfig"]["apis"].keys()]
+
+    # parsing is CPU bound: one worker per core, each taking a few
+    # proxies per task to amortise the inter-process round trips
+    workers = os.cpu_count() or 1
+    result = utils.run_parallel(
+        proxy_dependency_map_parallel, args, workers=workers,
+        chunksize=max(1, len(args) // (4 * workers)))
+    # workers return their own maps; merge them here, in one place
     res = {}
     for item in result:
-        for key, value in item.items():
-            res[key] = value
+        # run_parallel has already logged tasks that could not run
+        if item != "Exception":
+            res.update(item)
 
     return res
 
@@ -180,72 +230,82 @@ def proxy_dependency_map_parallel(arg_tuple):  # noqa pylint: disable=R0914
     Args:
         arg_tuple (tuple): A tuple containing \
         the API name,
-            proxy directory, and proxy dependency \
-            map.
+            proxy directory and `ProxyMapSettings`.
 
     Returns:
         dict: The proxy dependency map for the \
-        processed API.
+        processed API and its unifier splits. If \
+        the API fails, only its own entry, \
+        marked as not split.
     """
+    proxy_dependency_map_data = {}
+    each_dir, proxy_dir, settings = arg_tuple
     try:
-        each_dir = arg_tuple[0]
-        proxy_dir = arg_tuple[1]
-        proxy_dependency_map_data = arg_tuple[2]
         logger.info(f"processing {each_dir}")  # noqa pylint: disable=W1203
-        if not os.path.exists(f"{proxy_dir}/{each_dir}/apiproxy"):
+        bundle = os.path.join(settings.bundle_dir, f"{each_dir}.zip")
+        if os.path.isfile(bundle):
+            _extract_bundle(bundle, os.path.join(proxy_dir, each_dir))
+        apiproxy_path = os.path.join(proxy_dir, each_dir, 'apiproxy')
+        if not os.path.exists(apiproxy_path):
             proxy_dependency_map_data[each_dir] = {
                 'is_split': False
             }
             return proxy_dependency_map_data
         each_proxy_dict = utils.read_proxy_artifacts(
-            f"{proxy_dir}/{each_dir}/apiproxy",
-            utils.parse_proxy_root_sharding(
-                f"{proxy_dir}/{each_dir}/apiproxy")
-        )
+            apiproxy_path, utils.parse_proxy_root_sharding(apiproxy_path))
 
         each_proxy_rel = utils.get_proxy_objects_relationships(each_proxy_dict)  # noqa pylint: disable=C0301
         proxy_dependency_map_data[each_dir] = {}
 
-        # checking if the pe > count_provided
-        cfg = utils.parse_config('backend.properties')
-        proxy_endpoint_cnt = utils.get_proxy_endpoint_count(cfg)
-        input_cfg = utils.parse_config('input.properties')
-        export_dir_name = cfg.get('export', 'EXPORT_DIR')
-        target_dir = input_cfg.get('inputs', 'TARGET_DIR')
-        unifier_output_dir = cfg.get('unifier', 'unifier_output_dir')
+        # splits carry a subset of this proxy's policies, so the
+        # policies are checked once and every report reuses that
+        findings = policy_findings(each_proxy_dict['Policies'])
 
-        if len(each_proxy_rel.keys()) > proxy_endpoint_cnt:
+        # checking if the pe > count_provided
+        if len(each_proxy_rel.keys()) > settings.proxy_endpoint_cnt:
 
             proxy_split_result = unifier.proxy_unifier(each_dir)
             proxy_dependency_map_data[each_dir]["is_split"] = True
-            proxy_dependency_map_data[each_dir]["split_output_names"] = []
-            for dir_name in proxy_split_result:
-                proxy_dependency_map_data[dir_name] = {}
-                proxy_dict = utils.read_proxy_artifacts(
-                    f"./{target_dir}/{export_dir_name}/{unifier_output_dir}/{dir_name}/apiproxy",  # noqa pylint: disable=C0301
-                    utils.parse_proxy_root_sharding(
-                        f"./{target_dir}/{export_dir_name}/{unifier_output_dir}/{dir_name}/apiproxy")  # noqa pylint: disable=C0301
-                )
-
+            proxy_dependency_map_data[each_dir]["split_output_names"] = list(
+                proxy_split_result)
+            # the unifier hands back the split proxies it wrote, so
+            # they are not parsed again from disk
+            for dir_name, proxy_dict in proxy_split_result.items():
+                split_entry = proxy_dependency_map_data[dir_name] = {}
                 proxy_rel = utils.get_proxy_objects_relationships(proxy_dict)
-                proxy_dependency_map_data = build_proxy_dependency(
+                build_proxy_dependency(
                     proxy_dependency_map_data, proxy_rel, proxy_dict, dir_name)
-                proxy_dependency_map_data[dir_name]["qualification"] = qualification_report_info(  # noqa pylint: disable=C0301
-                    proxy_dict)
-                proxy_dependency_map_data[dir_name]["unifier_created"] = True
-                proxy_dependency_map_data[each_dir]["split_output_names"].append(  # noqa pylint: disable=C0301
-                    dir_name)
+                # the unifier parses the root with a filesystem
+                # fallback, so a split can hold policies the parent
+                # dict lacks; check those here
+                parent_policies = each_proxy_dict['Policies']
+                extra_policies = {
+                    name: policy
+                    for name, policy in proxy_dict['Policies'].items()
+                    if name not in parent_policies}
+                split_findings = findings
+                if extra_policies:
+                    split_findings = {**findings,
+                                      **policy_findings(extra_policies)}
+                split_entry["qualification"] = qualification_report_info(
+                    proxy_dict, split_findings)
+                split_entry["unifier_created"] = True
         else:
             proxy_dependency_map_data = build_proxy_dependency(
                 proxy_dependency_map_data, each_proxy_rel, each_proxy_dict, each_dir)  # noqa pylint: disable=C0301
         proxy_dependency_map_data[each_dir]["qualification"] = qualification_report_info(  # noqa pylint: disable=C0301
-            each_proxy_dict)
+            each_proxy_dict, findings)
 
     except Exception as error:   # noqa pylint: disable=W0718
         logger.error(  # noqa pylint: disable=W1203
-            f"Error in proxy dependency map parallel function. ERROR-INFO - {error} {each_dir}")  # noqa pylint: disable=C0301
-        proxy_dependency_map_data[each_dir] = {
-            'is_split': False
+            f"Error in proxy dependency map parallel function. ERROR-INFO - {error} {each_dir}",  # noqa pylint: disable=C0301
+            exc_info=EXEC_INFO)
+        # drop anything half built, e.g. entries for splits made
+        # before the failure
+        proxy_dependency_map_data = {
+            each_dir: {
+                'is_split': False
+            }
         }
     return proxy_dependency_map_data
 
@@ -270,64 +330,67 @@ def build_proxy_dependency(proxy_dependency_map_data, each_proxy_rel,  # noqa py
     Returns:
         dict: The updated proxy dependency map.
     """
-    for proxyname, _ in each_proxy_rel.items():  # noqa pylint: disable=R1702
-        if each_proxy_rel[proxyname].get('Policies') is not None:
-            for eachpolicy in each_proxy_rel[proxyname]['Policies']:
-                if "FlowCallout" in list(each_proxy_dict['Policies'][eachpolicy].keys()):  # noqa pylint: disable=C0301
-                    if "SharedFlowBundle" in each_proxy_dict['Policies'][eachpolicy]["FlowCallout"]:  # noqa pylint: disable=C0301
-                        if not proxy_dependency_map_data[each_dir].get('SharedFlow'):  # noqa pylint: disable=C0301
-                            proxy_dependency_map_data[each_dir]['SharedFlow'] = [  # noqa pylint: disable=C0301
-                                each_proxy_dict['Policies'][eachpolicy]["FlowCallout"]["SharedFlowBundle"]]  # noqa pylint: disable=C0301
-                        else:
-                            proxy_dependency_map_data[each_dir]['SharedFlow'].append(  # noqa pylint: disable=C0301
-                                each_proxy_dict['Policies'][eachpolicy]["FlowCallout"]["SharedFlowBundle"])  # noqa pylint: disable=C0301
-
-                if "KeyValueMapOperations" in list(each_proxy_dict['Policies'][eachpolicy].keys()):  # noqa pylint: disable=C0301
-                    kvmname = each_proxy_dict['Policies'][eachpolicy]['KeyValueMapOperations'].get(  # noqa pylint: disable=C0301
-                        '@mapIdentifier')
-                    if not proxy_dependency_map_data[each_dir].get('KVM'):
-                        proxy_dependency_map_data[each_dir]['KVM'] = [kvmname]
-                    else:
-                        proxy_dependency_map_data[each_dir]['KVM'].append(kvmname)  # noqa pylint: disable=C0301
-
-        if each_proxy_rel[proxyname].get('TargetEndpoints') is not None:
-            for eachtargetendpoint in each_proxy_rel[proxyname]['TargetEndpoints']:  # noqa pylint: disable=C0301
-                if 'HostedTarget' in each_proxy_dict['TargetEndpoints'][eachtargetendpoint]['TargetEndpoint'].keys():  # noqa pylint: disable=C0301
-                    return proxy_dependency_map_data
-                if 'LocalTargetConnection' in each_proxy_dict['TargetEndpoints'][eachtargetendpoint]['TargetEndpoint'].keys():  # noqa pylint: disable=C0301
-                    return proxy_dependency_map_data
-                targetservers = each_proxy_dict['TargetEndpoints'][eachtargetendpoint]['TargetEndpoint']['HTTPTargetConnection'].get(  # noqa pylint: disable=C0301
-                    'LoadBalancer')
-                if targetservers is not None:
-                    if isinstance(targetservers.get('Server'), dict):
-                        if not proxy_dependency_map_data[each_dir].get("TargetServer"):  # noqa pylint: disable=C0301
-                            proxy_dependency_map_data[each_dir]["TargetServer"] = [  # noqa pylint: disable=C0301
-                                targetservers.get('@name')]
-                        else:
-                            proxy_dependency_map_data[each_dir]["TargetServer"].append(  # noqa pylint: disable=C0301
-                                targetservers.get('@name'))
-                    else:
-                        for targetdict in targetservers.get('Server'):
-                            if not proxy_dependency_map_data[each_dir].get("TargetServer"):  # noqa pylint: disable=C0301
-                                proxy_dependency_map_data[each_dir]["TargetServer"] = [  # noqa pylint: disable=C0301
-                                    targetdict.get('@name')]
-                            else:
-                                proxy_dependency_map_data[each_dir]["TargetServer"].append(  # noqa pylint: disable=C0301
-                                    targetdict.get('@name'))
+    entry = proxy_dependency_map_data[each_dir]
+    policies = each_proxy_dict['Policies']
+    target_endpoints = each_proxy_dict['TargetEndpoints']
+    for proxy_rel in each_proxy_rel.values():  # noqa pylint: disable=R1702
+        for eachpolicy in proxy_rel.get('Policies') or ():
+            policy = policies[eachpolicy]
+            flow_callout = policy.get("FlowCallout")
+            if flow_callout is not None and "SharedFlowBundle" in flow_callout:  # noqa pylint: disable=C0301
+                _append_unique(entry, 'SharedFlow',
+                               flow_callout["SharedFlowBundle"])
+
+            kvm_operations = policy.get("KeyValueMapOperations")
+            if kvm_operations is not None:
+                _append_unique(entry, 'KVM',
+                               kvm_operations.get('@mapIdentifier'))
+
+        for eachtargetendpoint in proxy_rel.get('TargetEndpoints') or ():
+            target_endpoint = target_endpoints[eachtargetendpoint]['TargetEndpoint']  # noqa pylint: disable=C0301
+            # hosted and proxy-chained targets have no target servers
+            # or references; skip just this endpoint
+            if ('HostedTarget' in target_endpoint
+                    or 'LocalTargetConnection' in target_endpoint):
+                continue
+            http_target_connection = target_endpoint.get(
+                'HTTPTargetConnection') or {}
+            targetservers = http_target_connection.get('LoadBalancer')
+            if targetservers is not None:
+                servers = targetservers.get('Server')
+                if isinstance(servers, dict):
+                    _append_unique(entry, "TargetServer",
+                                   targetservers.get('@name'))
                 else:
-                    if each_proxy_dict['TargetEndpoints'][eachtargetendpoint]['TargetEndpoint']['HTTPTargetConnection'].get('SSLInfo'):  # noqa pylint: disable=C0301
-                        sslinfo = each_proxy_dict['TargetEndpoints'][eachtargetendpoint]['TargetEndpoint']['HTTPTargetConnection'].get(  # noqa pylint: disable=C0301
-                            'SSLInfo')
-                        if not proxy_dependency_map_data[each_dir].get("References"):  # noqa pylint: disable=C0301
-                            proxy_dependency_map_data[each_dir]["References"] = [  # noqa pylint: disable=C0301
-                                {"Keystore": sslinfo.get('KeyStore'), "Trustore": sslinfo.get('TrustStore')}]  # noqa pylint: disable=C0301
-                        else:
-                            proxy_dependency_map_data[each_dir]["References"].append(  # noqa pylint: disable=C0301
-                                {"Keystore": sslinfo.get('KeyStore'), "Trustore": sslinfo.get('TrustStore')})  # noqa pylint: disable=C0301
+                    for targetdict in servers:
+                        _append_unique(entry, "TargetServer",
+                                       targetdict.get('@name'))
+            else:
+                sslinfo = http_target_connection.get('SSLInfo')
+                if sslinfo:
+                    entry.setdefault("References", []).append(
+                        {"Keystore": sslinfo.get('KeyStore'), "Trustore": sslinfo.get('TrustStore')})  # noqa pylint: disable=C0301
 
     return proxy_dependency_map_data
 
 
+def _append_unique(entry, key, value):
+    """Appends value to entry[key] unless it is already listed.
+
+    Dependencies stay lists so the map remains JSON serialisable;
+    a proxy references only a handful of names, so the membership
+    scan is short.
+
+    Args:
+        entry (dict): A proxy's dependency map entry.
+        key (str): The dependency type, e.g. 'SharedFlow'.
+        value (str): The dependency name.
+    """
+    values = entry.setdefault(key, [])
+    if value not in values:
+        values.append(value)
+
+
 def sharding_wrapper(proxy_dependency_map_data, export_data):
     """Manages environment sharding based on \
     proxy dependencies.
@@ -348,23 +411,40 @@ def sharding_wrapper(proxy_dependency_map_data, export_data):
     """
     shard_result = {}
 
-    for env, values in export_data["envConfig"].items():
-        result_dict = {}
-        for apiname in values["apis"].keys():
-            if proxy_dependency_map_data[apiname].get("is_split") is not True:
-                result_dict[apiname] = proxy_dependency_map_data[apiname]
-            else:
-                for splits in proxy_dependency_map_data[apiname]["split_output_names"]:  # noqa pylint: disable=C0301
-                    result_dict[splits] = proxy_dependency_map_data[splits]
+    # (name, dependencies, api) for what each API deploys as: its
+    # unifier splits if it was split, else itself; sorted by name
+    # once, each environment takes its APIs' entries in that order
+    deployed = []
+    for apiname, dependencies in proxy_dependency_map_data.items():
+        if dependencies.get("is_split") is True:
+            deployed.extend(
+                (splits, proxy_dependency_map_data[splits], apiname)
+                for splits in dependencies["split_output_names"])
+        elif not dependencies.get("unifier_created"):
+            deployed.append((apiname, dependencies, apiname))
+    deployed.sort(key=operator.itemgetter(0))
+    deployed_apis = {apiname for _, _, apiname in deployed}
 
-        result = environment_sharding(env, result_dict)
-        shard_result[env] = result[0]
-        shard_result[env]["not_processed_apis"] = result[1]
+    for env, values in export_data["envConfig"].items():
+        env_apis = values["apis"]
+        result_items = [(name, dependencies)
+                        for name, dependencies, apiname in deployed
+                        if apiname in env_apis]
+
+        env_slot, notprocessed = environment_sharding(env, result_items)
+        # APIs with no dependency map entry cannot be placed
+        for apiname in env_apis:
+            if apiname not in deployed_apis:
+                logger.warning(  # noqa pylint: disable=W1203
+                    f"API {apiname} in environment {env} has no proxy dependency map entry; not sharded")  # noqa pylint: disable=C0301
+                notprocessed[apiname] = {}
+        env_slot["not_processed_apis"] = notprocessed
+        shard_result[env] = env_slot
 
     return shard_result
 
 
-def environment_sharding(env, proxy_dependency_map_data):  # noqa pylint: disable=R0912
+def environment_sharding(env, proxy_items):  # noqa pylint: disable=R0912
     """Implements sharding logic for a single \
     environment.
 
@@ -374,8 +454,9 @@ def environment_sharding(env, proxy_dependency_map_data):  # noqa pylint: disabl
 
     Args:
         env (str): Environment name.
-        proxyDependencyMap (dict): Proxy \
-        dependency map.
+        proxy_items (list): (proxy name, \
+        dependencies) pairs sorted by \
+        proxy name.
 
     Returns:
         tuple: (env_slot, notprocessed)
@@ -385,145 +466,123 @@ def environment_sharding(env, proxy_dependency_map_data):  # noqa pylint: disabl
             couldn't be
                 processed due to shared flow limits.
     """
-    # sort proxyDependencyMap in alphabetically order
-    my_keys = list(proxy_dependency_map_data.keys())
-    my_keys.sort()
-    sorted_proxy_dependency_map = {i: proxy_dependency_map_data[i] for i in my_keys}  # noqa pylint: disable=C0301
-
-    cfg = utils.parse_config('backend.properties')
+    cfg = utils.parse_config_once('backend.properties')
     per_env_proxy_limit = cfg.getint('inputs', 'NO_OF_PROXIES_PER_ENV_LIMITS')  # noqa pylint: disable=C0301
     total_units_per_envn = cfg.getint(
         'inputs', 'NO_OF_PROXIES_AND_SHARED_FLOWS_PER_ENV_LIMITS')
 
     env_name = env
     env_slot = {}
+    # shared flows and target servers of each slot, kept as sets
+    # alongside the lists in env_slot
+    slot_members = {}
     slot_cntr = 1
     notprocessed = {}
-    for apiname, dependencies in sorted_proxy_dependency_map.copy().items():
+    # proxies not placed yet, in name order; the pass below keeps
+    # the ones it could not place
+    unplaced = []
+    for apiname, dependencies in proxy_items:
         if dependencies.get("SharedFlow") and len(dependencies.get("SharedFlow")) > (total_units_per_envn-1):  # noqa pylint: disable=C0301
             notprocessed[apiname] = dependencies
-            del sorted_proxy_dependency_map[apiname]
-
-    while sorted_proxy_dependency_map:
-
-        if not env_slot or not env_slot.get(env_name+str(slot_cntr)):
-            env_slot[env_name+str(slot_cntr)] = dict(
-                {"proxyname": [], "shared_flow": [], "target_server": []})
-
-        # check total proxies in a slot
-        if (len(env_slot[env_name+str(slot_cntr)]["proxyname"]) >= per_env_proxy_limit   # noqa pylint: disable=C0301
-            or (len(env_slot[env_name+str(slot_cntr)]["proxyname"]) + len(env_slot[env_name+str(slot_cntr)]["shared_flow"]) >= total_units_per_envn)):  # noqa pylint: disable=C0301
-            slot_cntr = slot_cntr + 1
-            env_slot[env_name+str(slot_cntr)] = dict(
-                {"proxyname": [], "shared_flow": [], "target_server": []})
-
-        # add proxies and sharedflow provided sum of it <= than 60
-        for apiname, dependencies in sorted_proxy_dependency_map.copy().items():  # noqa pylint: disable=C0301
-            if (len(env_slot[env_name+str(slot_cntr)]["proxyname"]) < per_env_proxy_limit  # noqa pylint: disable=C0301
-                and ((len(env_slot[env_name+str(slot_cntr)]["proxyname"]) + len(find_unique_items(dependencies.get("SharedFlow"), env_slot[env_name+str(slot_cntr)]["shared_flow"]))) < total_units_per_envn)):  # noqa pylint: disable=C0301
+        else:
+            unplaced.append((apiname, dependencies))
+
+    while unplaced:
+
+        # every iteration fills a fresh slot; the pass below left
+        # the previous one unable to take any remaining proxy
+        slot_name = env_name+str(slot_cntr)
+        _new_slot(env_slot, slot_members, slot_name)
+        slot = env_slot[slot_name]
+        shared_flows, target_servers = slot_members[slot_name]
+
+        # add proxies and sharedflow provided sum of it <= than 60.
+        # A slot only fills up, so a proxy that does not fit here
+        # cannot fit later in this slot; one greedy pass places
+        # every proxy the slot can take, including those whose
+        # shared flows or target servers the slot already has
+        proxynames = slot["proxyname"]
+        remaining = []
+        for apiname, dependencies in unplaced:
+            proxy_shared_flows = dependencies.get("SharedFlow")
+            if _fits(slot, shared_flows, proxy_shared_flows,
+                     per_env_proxy_limit, total_units_per_envn):
 
                 # add proxy name
-                env_slot[env_name+str(slot_cntr)]["proxyname"].append(apiname)  # noqa pylint: disable=C0301
+                proxynames.append(apiname)
 
                 # add unique shared flows
-
-                unique_shared_flow = find_unique_items(
-                    env_slot[env_name+str(slot_cntr)]["shared_flow"], dependencies.get("SharedFlow"))  # noqa pylint: disable=C0301
-                if unique_shared_flow:
-                    env_slot[env_name+str(slot_cntr)]["shared_flow"].clear()  # noqa pylint: disable=C0301
-                    env_slot[env_name+str(slot_cntr)
-                             ]["shared_flow"].extend(unique_shared_flow)
+                _add_unique(proxy_shared_flows,
+                            slot["shared_flow"], shared_flows)
 
                 # add unique target servers
-                unique_target_server = find_unique_items(
-                    env_slot[env_name+str(slot_cntr)]["target_server"], dependencies.get("TargetServer"))  # noqa pylint: disable=C0301
-                if unique_target_server:
-                    env_slot[env_name+str(slot_cntr)]["target_server"].clear()  # noqa pylint: disable=C0301
-                    env_slot[env_name+str(slot_cntr)
-                             ]["target_server"].extend(unique_target_server)  # noqa pylint: disable=C0301
-
-                # remove proxy from proxy dependency map
-                del sorted_proxy_dependency_map[apiname]
-
-        # add proxies that have same sharedflow
-        for apiname, dependencies in sorted_proxy_dependency_map.copy().items():  # noqa pylint: disable=C0301
-
-            if len(env_slot[env_name+str(slot_cntr)]["proxyname"]) < per_env_proxy_limit and ((len(env_slot[env_name+str(slot_cntr)]["proxyname"]) + len(find_unique_items(dependencies.get("SharedFlow"), env_slot[env_name+str(slot_cntr)]["shared_flow"]))) < total_units_per_envn):  # noqa pylint: disable=C0301
-
-                if is_subset(dependencies.get("SharedFlow"), env_slot[env_name+str(slot_cntr)].get("shared_flow")):  # noqa pylint: disable=C0301
-                    # add proxy name
-                    env_slot[env_name+str(slot_cntr)
-                             ]["proxyname"].append(apiname)
-
-                    # add unique target servers
-                    if dependencies.get("TargetServer"):
-                        unique_target_server = find_unique_items(
-                            env_slot[env_name+str(slot_cntr)]["target_server"], dependencies.get("TargetServer"))  # noqa pylint: disable=C0301
-                        env_slot[env_name+str(slot_cntr)
-                                 ]["target_server"].clear()
-                        env_slot[env_name+str(slot_cntr)
-                                 ]["target_server"].extend(unique_target_server)  # noqa pylint: disable=C0301
-
-                    # remove proxy from proxy dependency map
-                    del sorted_proxy_dependency_map[apiname]
+                _add_unique(dependencies.get("TargetServer"),
+                            slot["target_server"], target_servers)
+            else:
+                remaining.append((apiname, dependencies))
+        unplaced = remaining
 
-        # add proxies that do not have sharedflow but share same target servers  # noqa pylint: disable=C0301
-        for apiname, dependencies in sorted_proxy_dependency_map.copy().items():  # noqa pylint: disable=C0301
+        slot_cntr = slot_cntr+1
+    return [env_slot, notprocessed]
 
-            if len(env_slot[env_name+str(slot_cntr)]["proxyname"]) < per_env_proxy_limit and ((len(env_slot[env_name+str(slot_cntr)]["proxyname"]) + len(find_unique_items(dependencies.get("SharedFlow"), env_slot[env_name+str(slot_cntr)]["shared_flow"]))) < total_units_per_envn):  # noqa pylint: disable=C0301
 
-                if not dependencies.get('SharedFlow') and is_subset(dependencies.get("TargetServer"), env_slot[env_name+str(slot_cntr)].get("target_server")):  # noqa pylint: disable=C0301
-                    # add proxy name
-                    env_slot[env_name+str(slot_cntr)
-                             ]["proxyname"].append(apiname)
+def _new_slot(env_slot, slot_members, slot_name):
+    """Adds an empty slot to env_slot and slot_members.
 
-                    # remove from proxy dependency map
-                    del sorted_proxy_dependency_map[apiname]
+    Args:
+        env_slot (dict): Slots of the environment.
+        slot_members (dict): Shared flow and target
+            server sets of each slot.
+        slot_name (str): The slot to add.
+    """
+    env_slot[slot_name] = {"proxyname": [], "shared_flow": [],
+                           "target_server": []}
+    slot_members[slot_name] = (set(), set())
 
-        # add proxies that do not have any shareflow and target servers
-        for apiname, dependencies in sorted_proxy_dependency_map.copy().items():  # noqa pylint: disable=C0301
-            if not dependencies.get("SharedFlow") and not dependencies.get("TargetServer"):  # noqa pylint: disable=C0301
 
-                if len(env_slot[env_name+str(slot_cntr)]["proxyname"]) < per_env_proxy_limit and ((len(env_slot[env_name+str(slot_cntr)]["proxyname"]) + len(find_unique_items(dependencies.get("SharedFlow"), env_slot[env_name+str(slot_cntr)]["shared_flow"]))) < total_units_per_envn):  # noqa pylint: disable=C0301
-                    # add proxy name
-                    env_slot[env_name+str(slot_cntr)
-                             ]["proxyname"].append(apiname)
+def _add_unique(items, item_list, item_set):
+    """Appends the items not already in item_set to item_list.
 
-                    # remove from proxy dependency map
-                    del sorted_proxy_dependency_map[apiname]
+    Args:
+        items (list): Items to add, or None.
+        item_list (list): The list to extend.
+        item_set (set): The items of item_list; updated in place.
+    """
+    for item in items or ():
+        if item not in item_set:
+            item_set.add(item)
+            item_list.append(item)
 
-        slot_cntr = slot_cntr+1
-    return [env_slot, notprocessed]
 
+def _fits(slot, shared_flows, items, proxy_limit, unit_limit):
+    """Checks whether a proxy fits in a slot.
 
-def find_unique_items(list1, list2):
-    """Finds the union of two lists, preserving \
-        unique items.
+    The slot must stay under proxy_limit proxies, and its
+    proxies plus distinct shared flows must stay under
+    unit_limit once the proxy and any of its shared flows
+    missing from the slot are added. The scan over items
+    stops as soon as the budget is exceeded.
 
     Args:
-        list1 (list): First list.
-        list2 (list): Second list.
+        slot (dict): The slot from env_slot.
+        shared_flows (set): The shared flows of the slot.
+        items (list): The proxy's distinct shared flows, or None.
+        proxy_limit (int): Maximum proxies per slot.
+        unit_limit (int): Maximum proxies and shared flows
+            per slot.
 
     Returns:
-        set or list: Union of unique items, or \
-        original
-                    list if only one is provided.
+        bool: True if the proxy can be added.
     """
-    if list1 and list2:
-        unique_items = set(list1) | set(list2)
-        return unique_items
-    if list1:
-        return list1
-    return list2
-
-
-def is_subset(list1, list2):
-    """Returns True if list1 is a subset of list2, False otherwise."""
-    if not list1 or not list2:
-        return True
-
-    for item in list1:
-        if item not in list2:
-            return False
-
+    proxy_count = len(slot["proxyname"])
+    if proxy_count >= proxy_limit:
+        return False
+    room = unit_limit - proxy_count - len(shared_flows) - 1
+    if room < 0:
+        return False
+    for item in items or ():
+        if item not in shared_flows:
+            room -= 1
+            if room < 0:
+                return False
     return True
@@ -29,6 +29,12 @@ from topology_mapping.pod import pod_mapping
 from utils import write_json, parse_config
 from base_logger import logger
 
+# Pod component details kept in the topology mapping; missing ones
+# are recorded as ""
+POD_COMPONENT_FIELDS = (
+    "externalHostName", "externalIP", "internalHostName", "internalIP",
+    "isUp", "pod", "reachable", "region", "type")
+
 
 class ApigeeTopology():
     """Represents and visualizes Apigee topology.
@@ -85,16 +91,8 @@ class ApigeeTopology():
 
             for result in result_arr:
                 component_type_resp.append({
-                    "externalHostName": result["externalHostName"] if "externalHostName" in result else "",  # noqa pylint: disable=C0301
-                    "externalIP": result["externalIP"] if "externalIP" in result else "",  # noqa
-                    "internalHostName": result["internalHostName"] if "internalHostName" in result else "",  # noqa pylint: disable=C0301
-                    "internalIP": result["internalIP"] if "internalIP" in result else "",  # noqa
-                    "isUp": result["isUp"] if "isUp" in result else "",
-                    "pod": result["pod"] if "pod" in result else "",
-                    "reachable": result["reachable"] if "reachable" in result else "",  # noqa
-                    "region": result["region"] if "region" in result else "",  # noqa
-                    "type": result["type"] if "type" in result else ""
-                })
+                    field: result.get(field, "")
+                    for field in POD_COMPONENT_FIELDS})
 
             pod_component_result[f'{pod_name}'] = component_type_resp
 
@@ -119,17 +117,11 @@ class ApigeeTopology():
         logger.info('In get data center mapping from network topology mapping')  # noqa
         data_center = {}
 
-        for pod in pod_component_mapping:
-            for component_instance in pod_component_mapping[pod]:
-
-                if component_instance['region'] not in data_center:
-                    data_center[component_instance['region']] = {}
-
-                if component_instance['pod'] not in data_center[component_instance['region']]:  # noqa pylint: disable=C0301
-                    data_center[component_instance['region']
-                                ][component_instance['pod']] = []
-
-                data_center[component_instance['region']][component_instance['pod']].append(  # noqa pylint: disable=C0301
+        for components in pod_component_mapping.values():
+            for component_instance in components:
+                region_pods = data_center.setdefault(
+                    component_instance['region'], {})
+                region_pods.setdefault(component_instance['pod'], []).append(
                     component_instance)
 
         datacenter_mapping = self.backend_cfg.get('topology', 'DATA_CENTER_MAPPING')  # noqa
@@ -176,16 +168,19 @@ class ApigeeTopology():
                     for pod in data_center[dc]:
                         with Cluster(pod, graph_attr=pod_attr):
                             for pod_instance in data_center[dc][pod]:
-                                if not pod_instance['internalIP'] in internal_ip_clusters:  # noqa
-                                    internal_ip_clusters[pod_instance['internalIP']] = [  # noqa
-                                    ]
-                                internal_ip_clusters[pod_instance['internalIP']].append(  # noqa
+                                internal_ip_clusters.setdefault(
+                                    pod_instance['internalIP'], []).append(
                                     pod_instance)
 
+                            # IP clusters take the pod's colour; ip_attr
+                            # itself is left as is for the next diagram
+                            pod_ip_attr = {
+                                **ip_attr,
+                                'bgcolor': pod_mapping[pod]["bgcolor"],
+                            }
                             svc_group = []
                             for ip_grp, ip_grp_value in internal_ip_clusters.items():       # noqa pylint: disable=C0301
-                                ip_attr['bgcolor'] = pod_mapping[pod]["bgcolor"]  # noqa
-                                with Cluster(ip_grp, graph_attr=ip_attr):  # noqa
+                                with Cluster(ip_grp, graph_attr=pod_ip_attr):  # noqa
                                     for int_ip in ip_grp_value:  # noqa
                                         for component in int_ip['type']:  # noqa
                                             svc_group.append(
@@ -197,10 +192,8 @@ class ApigeeTopology():
                 with Cluster(dc, graph_attr=data_center_attr):
                     for pod in data_center[dc]:
                         for pod_instance in data_center[dc][pod]:
-                            if not pod_instance['internalIP'] in internal_ip_clusters:  # noqa
-                                internal_ip_clusters[pod_instance['internalIP']] = [  # noqa
-                                ]
-                            internal_ip_clusters[pod_instance['internalIP']].append(  # noqa
+                            internal_ip_clusters.setdefault(
+                                pod_instance['internalIP'], []).append(
                                 pod_instance)
 
                     svc_group = []
@@ -42,13 +42,16 @@ def proxy_unifier(proxy_dir_name):  # noqa pylint: disable=R0914
             proxy directory.
 
     Returns:
-        dict: A dictionary containing merged
-            proxy objects information.
+        dict: The proxy dictionary of each split
+            proxy, keyed by its directory name, in
+            the shape `utils.read_proxy_artifacts`
+            returns for the written bundle.
     """
+    split_proxies = {}
     try:
-        inputs_cfg = utils.parse_config('input.properties')
+        inputs_cfg = utils.parse_config_once('input.properties')
 
-        cfg = utils.parse_config('backend.properties')
+        cfg = utils.parse_config_once('backend.properties')
         proxy_dir = f"./{inputs_cfg.get('inputs', 'TARGET_DIR')}/{cfg.get('export','EXPORT_DIR')}{cfg['unifier']['source_unzipped_apis']}"  # noqa pylint: disable=C0301
         proxy_dest_dir = f"./{inputs_cfg.get('inputs', 'TARGET_DIR')}/{cfg.get('export','EXPORT_DIR')}/{cfg['unifier']['unifier_output_dir']}"  # noqa pylint: disable=C0301
         proxy_bundle_directory = f"./{inputs_cfg.get('inputs', 'TARGET_DIR')}/{cfg.get('export','EXPORT_DIR')}/{cfg['unifier']['unifier_zipped_bundles']}"  # noqa pylint: disable=C0301
@@ -62,11 +65,9 @@ def proxy_unifier(proxy_dir_name):  # noqa pylint: disable=R0914
         processed_dict = {}
         each_dir = proxy_dir_name
 
+        apiproxy_path = f"{proxy_dir}/{each_dir}/apiproxy"
         each_proxy_dict = utils.read_proxy_artifacts(
-            f"{proxy_dir}/{each_dir}/apiproxy",
-            utils.parse_proxy_root(
-                f"{proxy_dir}/{each_dir}/apiproxy")
-        )
+            apiproxy_path, utils.parse_proxy_root(apiproxy_path))
 
         if len(each_proxy_dict) > 0:
             each_proxy_rel = utils.get_proxy_objects_relationships(
@@ -115,16 +116,39 @@ def proxy_unifier(proxy_dir_name):  # noqa pylint: disable=R0914
                     merged_objects[f"{each_api}_{index}"]['ProxyEndpoints'].append(each_pe)  # noqa
 
         for each_api, grouped_api in bundled_group.items():
+            api_dict = final_dict[each_api]
             for index, each_group in enumerate(grouped_api):
+                objects = merged_objects[f"{each_api}_{index}"]
 
                 utils.clone_proxies(
-                    f"{proxy_dir}/{each_api}/apiproxy",
+                    apiproxy_path,
                     f"{proxy_dest_dir}/{each_api}_{index}",
-                    merged_objects[f"{each_api}_{index}"],
+                    objects,
                     merged_pes,
                     proxy_bundle_directory
                 )
 
+                # what reading the written bundle back would produce;
+                # objects lists come from sets, so keep the source
+                # proxy's order instead of theirs
+                policy_names = set(objects['Policies'])
+                target_names = set(objects['TargetEndpoints'])
+                split_proxies[f"{each_api}_{index}"] = {
+                    'BasePaths': api_dict['BasePaths'],
+                    'Policies': {
+                        name: policy
+                        for name, policy in api_dict['Policies'].items()
+                        if name in policy_names},
+                    'ProxyEndpoints': {
+                        name: merged_pes[name]
+                        for name in objects['ProxyEndpoints']},
+                    'TargetEndpoints': {
+                        name: target
+                        for name, target in api_dict['TargetEndpoints'].items()  # noqa pylint: disable=C0301
+                        if name in target_names},
+                    'proxyName': objects['Name'],
+                }
+
         files = {
             'final_dict': final_dict,
             'processed_dict': processed_dict,
@@ -140,4 +164,4 @@ def proxy_unifier(proxy_dir_name):  # noqa pylint: disable=R0914
     except Exception as error:  # noqa pylint: disable=W0718
         logger.error(  # noqa pylint: disable=W1203
             f"ERROR : Some error occured in unifier module. ERROR-INFO - {error}")  # noqa pylint: disable=W1203
-    return merged_objects
+    return split_proxies
@@ -27,10 +27,12 @@ import os
 import sys
 import csv
 import json
+import pickle
 import shutil
 import hashlib
 import configparser
 import concurrent.futures
+import functools
 from time import sleep
 import zipfile
 import requests  # pylint: disable=E0401
@@ -59,6 +61,24 @@ def parse_config(config_file):
     return config
 
 
+@functools.lru_cache(maxsize=None)
+def parse_config_once(config_file):
+    """Parses a configuration file once per process.
+
+    For hot paths such as the sharding workers. The parser
+    returned is shared between callers and must not be
+    modified.
+
+    Args:
+        config_file: The path to the \
+        configuration file.
+
+    Returns:
+        A ConfigParser object.
+    """
+    return parse_config(config_file)
+
+
 def get_env_variable(key):
     """Retrieves the value of an \
     environment variable.
@@ -384,8 +404,8 @@ def retry(retries=3, delay=1, backoff=2):  # noqa pylint: disable=W0613
     return decorator
 
 
-def run_parallel(func, args, workers=10,
-                 max_retries=3, retry_delay=1):
+def run_parallel(func, args, workers=10,  # noqa pylint: disable=R0913,R0917
+                 max_retries=3, retry_delay=1, chunksize=1):
     """Runs a function in parallel with \
     multiple arguments.
 
@@ -395,10 +415,27 @@ def run_parallel(func, args, workers=10,
         workers: Number of workers.
         max_retries: Max retry attempts.
         retry_delay: Retry delay.
+        chunksize: Number of arguments sent \
+        to a worker per task. A failed chunk \
+        is retried as a whole and reported \
+        as a single "Exception" entry.
 
     Returns:
         List of results.
     """
+    if chunksize > 1:
+        args = list(args)
+        chunks = [args[i:i + chunksize]
+                  for i in range(0, len(args), chunksize)]
+        data = []
+        for result in run_parallel(functools.partial(_run_chunk, func),
+                                   chunks, workers, max_retries,
+                                   retry_delay):
+            if result == "Exception":
+                data.append(result)
+            else:
+                data.extend(result)
+        return data
     with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:  # noqa
         # Initial futures (future: (arg, retry_count))
         future_to_arg_retry = {executor.submit(func, arg): (arg, 0) for arg in args}  # noqa
@@ -428,6 +465,20 @@ def run_parallel(func, args, workers=10,
     return data
 
 
+def _run_chunk(func, chunk):
+    """Runs a function over one chunk of \
+    `run_parallel` arguments.
+
+    Args:
+        func: Function to execute.
+        chunk: Arguments for the function.
+
+    Returns:
+        List of results.
+    """
+    return [func(arg) for arg in chunk]
+
+
 def get_proxy_entrypoint(dir_name):
     """Gets the proxy entrypoint XML file.
 
@@ -464,6 +515,10 @@ def get_proxy_entrypoint(dir_name):
 def parse_xml(file):
     """Parses XML data from a file.
 
+    Parsed files are cached per process, keyed on path,
+    modification time and size, so the unifier re-reading
+    a bundle that sharding just parsed costs an unpickle
+    instead of a parse. Every call returns a fresh copy.
 
     Args:
         file: Path to XML file.
@@ -472,14 +527,33 @@ def parse_xml(file):
         Parsed XML data as a dictionary.
     """
     try:
-        with open(file) as fl:  # noqa pylint: disable=W1514
-            doc = xmltodict.parse(fl.read())
-        return doc
+        stat = os.stat(file)
+        return pickle.loads(_parse_xml_cached(
+            os.path.abspath(file), stat.st_mtime_ns, stat.st_size))
     except FileNotFoundError:
         logger.error(f"File \"{file}\" not found", exc_info=EXEC_INFO)  # noqa pylint: disable=W1203
     return {}
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_xml_cached(file, mtime_ns, size):  # noqa pylint: disable=W0613
+    """Parses an XML file into a pickled dictionary.
+
+    Args:
+        file: Absolute path to XML file.
+        mtime_ns: Modification time, part of the cache key.
+        size: File size, part of the cache key.
+
+    Returns:
+        bytes: The pickled document.
+    """
+    # expat reads the raw bytes in chunks and honours the encoding
+    # in the XML declaration; no str copy of the file is built
+    with open(file, 'rb') as fl:
+        doc = xmltodict.parse(fl)
+    return pickle.dumps(doc, pickle.HIGHEST_PROTOCOL)
+
+
 def get_proxy_files(dir_name, file_type='proxies'):
     """Gets proxy files of a specific type.
 